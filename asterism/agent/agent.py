@@ -1,5 +1,6 @@
 """Main Agent implementation using LangGraph."""
 
+import asyncio
 import sqlite3
 import uuid
 from collections.abc import AsyncGenerator
@@ -42,6 +43,7 @@ class Agent:
         mcp_executor: MCPExecutor,
         db_path: str | None = None,
         workspace_root: str = "./workspace",
+        plan_cache_enabled: bool = False,
     ):
         """
         Initialize the agent.
@@ -51,11 +53,13 @@ class Agent:
             mcp_executor: MCP executor for tool calls.
             db_path: Path to SQLite database for checkpoint storage. If None, uses default.
             workspace_root: Path to the workspace directory for context generation (default: ./workspace).
+            plan_cache_enabled: Reuse plans for repeated initial requests (default: False).
         """
         self.llm = llm
         self.mcp_executor = mcp_executor
         self.db_path = db_path  # Allow None for stateless mode
         self.workspace_root = workspace_root
+        self.plan_cache_enabled = plan_cache_enabled
         self._full_graph = None
         self._streaming_graph = None
         self._checkpointer: BaseCheckpointSaver | None = None
@@ -76,11 +80,8 @@ class Agent:
 
             Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
 
-            # Use check_same_thread=False for multi-threaded environments
-            if self.db_path == ":memory:":
-                self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
-            else:
-                self._conn = sqlite3.connect(self.db_path)
+            # astream runs the graph on a worker thread; SqliteSaver serializes access with its own lock
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
             self._checkpointer = SqliteSaver(self._conn)
         return self._checkpointer
 
@@ -212,9 +213,13 @@ class Agent:
         # Get initial state
         initial_state = _initialize_state(session_id, messages)
 
-        # Run the graph up to finalization (non-streaming for planning/execution)
+        # Run the graph up to finalization (non-streaming for planning/execution).
+        # The nodes make blocking LLM and MCP calls, so run them on a worker
+        # thread to keep the event loop free for other sessions.
         try:
-            final_state = graph.invoke(initial_state, config={"configurable": {"thread_id": session_id}})
+            final_state = await asyncio.to_thread(
+                graph.invoke, initial_state, config={"configurable": {"thread_id": session_id}}
+            )
         except Exception as e:
             # Graph execution failed
             yield (
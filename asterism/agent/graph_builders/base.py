@@ -72,6 +72,27 @@ def make_routing_function_with_end(agent: "Agent"):
     return _route
 
 
+def changed_fields(before: AgentState, after: AgentState) -> dict:
+    """Reduce a node's returned state to the fields it actually replaced.
+
+    Nodes build their result with shallow copies, so unchanged fields still
+    reference the incoming objects, and fields are compared by identity.
+    Nodes must therefore replace a field's value to change it, never mutate
+    it in place. Dropping the untouched fields saves LangGraph from running
+    reducers and bumping channel versions for them on every step. It does
+    not shrink checkpoints: the checkpointer still serializes the full
+    channel state on every put.
+
+    Args:
+        before: State passed into the node.
+        after: State returned by the node.
+
+    Returns:
+        Partial state update containing only new or replaced fields.
+    """
+    return {key: value for key, value in after.items() if key not in before or before[key] is not value}
+
+
 def _make_planner_node(agent: "Agent"):
     """Create planner node with dependencies injected."""
     from asterism.agent.nodes import planner_node
@@ -79,9 +100,10 @@ def _make_planner_node(agent: "Agent"):
     llm = agent.llm
     mcp_executor = agent.mcp_executor
     workspace_root = agent.workspace_root
+    plan_cache_enabled = agent.plan_cache_enabled
 
-    def _node(state: AgentState) -> AgentState:
-        return planner_node(llm, mcp_executor, state, workspace_root)
+    def _node(state: AgentState) -> dict:
+        return changed_fields(state, planner_node(llm, mcp_executor, state, workspace_root, plan_cache_enabled))
 
     return _node
 
@@ -93,8 +115,8 @@ def _make_executor_node(agent: "Agent"):
     llm = agent.llm
     mcp_executor = agent.mcp_executor
 
-    def _node(state: AgentState) -> AgentState:
-        return executor_node(llm, mcp_executor, state)
+    def _node(state: AgentState) -> dict:
+        return changed_fields(state, executor_node(llm, mcp_executor, state))
 
     return _node
 
@@ -105,8 +127,8 @@ def _make_evaluator_node(agent: "Agent"):
 
     llm = agent.llm
 
-    def _node(state: AgentState) -> AgentState:
-        return evaluator_node(llm, state)
+    def _node(state: AgentState) -> dict:
+        return changed_fields(state, evaluator_node(llm, state))
 
     return _node
 
@@ -117,7 +139,7 @@ def _make_finalizer_node(agent: "Agent"):
 
     llm = agent.llm
 
-    def _node(state: AgentState) -> AgentState:
-        return finalizer_node(llm, state)
+    def _node(state: AgentState) -> dict:
+        return changed_fields(state, finalizer_node(llm, state))
 
     return _node
@@ -64,6 +64,7 @@ class TaskResult(BaseModel):
     success: bool = Field(..., description="Whether the task succeeded")
     result: Any = Field(default=None, description="Result data from the task")
     error: str | None = Field(default=None, description="Error message if failed")
+    truncated: bool = Field(default=False, description="Whether oversized result content was cut")
     timestamp: datetime = Field(default_factory=datetime.now, description="When the task completed")
     llm_usage: LLMUsage | None = Field(default=None, description="LLM usage if task used LLM")
 
@@ -21,7 +21,7 @@ logger = logging.getLogger(__name__)
 def evaluator_node(llm: BaseLLMProvider, state: AgentState) -> AgentState:
     """Evaluate execution results and decide next action using LLM.
 
-    For linear plans with all tasks completed successfully, this will skip
+    For plans with all tasks completed successfully, this will skip
     the LLM evaluation and directly set the decision to finalize, saving
     tokens and reducing latency.
 
@@ -34,12 +34,12 @@ def evaluator_node(llm: BaseLLMProvider, state: AgentState) -> AgentState:
     """
     # Check if we can skip LLM evaluation for this state
     if can_skip_evaluation(state):
-        logger.info("[evaluator] Skipping LLM evaluation for completed linear plan")
+        logger.info("[evaluator] Skipping LLM evaluation for completed plan")
 
         # Create a finalize decision without LLM call
         evaluation = EvaluationResult(
             decision=EvaluationDecision.FINALIZE,
-            reasoning="All tasks in linear plan completed successfully. Fast-path to finalization.",
+            reasoning="All tasks in plan completed successfully. Fast-path to finalization.",
             context_updates={},
             suggested_changes=None,
         )
@@ -73,22 +73,11 @@ def _build_plan_info(state: AgentState) -> str:
 
 def _build_execution_history(state: AgentState) -> str:
     """Build execution results history."""
-    results = state.get("execution_results", [])
-    if not results:
-        return "No tasks executed yet."
-
-    lines = []
-    for result in results:
-        status = "✓" if result.success else "✗"
-        if result.success:
-            result_str = str(result.result)
-            if len(result_str) > 200:
-                result_str = result_str[:200] + "... [truncated]"
-            lines.append(f"{status} {result.task_id}: {result_str}")
-        else:
-            lines.append(f"{status} {result.task_id}: ERROR - {result.error}")
+    from asterism.agent.nodes.shared import format_execution_history
 
-    return "\n".join(lines)
+    # The evaluator sees the whole history, not just the most recent results
+    results = state.get("execution_results", [])
+    return format_execution_history(results, max_results=len(results))
 
 
 def _build_current_context(state: AgentState) -> str:
@@ -3,7 +3,6 @@
 from enum import StrEnum
 
 from asterism.agent.models import EvaluationDecision
-from asterism.agent.nodes.shared import is_linear_plan
 from asterism.agent.state import AgentState
 
 
@@ -20,8 +19,8 @@ def determine_route(state: AgentState) -> RouteTarget:
 
     Uses evaluation_result if available, falls back to logic-based routing.
 
-    For linear plans with all tasks completed successfully, routes directly
-    to finalizer without requiring an LLM evaluation, saving tokens and time.
+    For plans with all tasks completed successfully, routes directly to
+    finalizer without requiring an LLM evaluation, saving tokens and time.
 
     Args:
         state: Current agent state.
@@ -45,8 +44,10 @@ def determine_route(state: AgentState) -> RouteTarget:
 def can_skip_evaluation(state: AgentState) -> bool:
     """Check if LLM evaluation can be skipped for this state.
 
-    For linear plans where all tasks have completed successfully,
-    we can skip the evaluator LLM call and go directly to finalizer.
+    When every task in the current plan has run and its latest result
+    succeeded, there is nothing left for the evaluator to decide, so we
+    skip the evaluator LLM call and go directly to finalizer. This applies
+    to linear and branching plans alike.
 
     Args:
         state: Current agent state.
@@ -55,31 +56,24 @@ def can_skip_evaluation(state: AgentState) -> bool:
         True if evaluation can be skipped, False otherwise.
     """
     plan = state.get("plan")
-    if not plan:
-        return False
-
-    # Only skip for linear plans
-    if not is_linear_plan(plan):
+    if not plan or not plan.tasks:
         return False
 
-    current_index = state.get("current_task_index", 0)
-    total_tasks = len(plan.tasks)
-
     # All tasks completed
-    if current_index < total_tasks:
+    if state.get("current_task_index", 0) < len(plan.tasks):
         return False
 
-    # Check all tasks succeeded
-    execution_results = state.get("execution_results", [])
-    if not execution_results or len(execution_results) < total_tasks:
+    # The executor stops at the first failure, so a failed run usually ends
+    # in a failed result for one of this plan's tasks; that result is the
+    # latest for its task and rules out skipping without a history scan
+    results = state.get("execution_results", [])
+    if results and not results[-1].success and any(task.id == results[-1].task_id for task in plan.tasks):
         return False
 
-    # Verify all results are successful
-    for result in execution_results:
-        if not result.success:
-            return False
-
-    return True
+    # Check every task of this plan succeeded; results from earlier plans
+    # that were replanned away do not count against it
+    outcomes = {result.task_id: result.success for result in results}
+    return all(outcomes.get(task.id, False) for task in plan.tasks)
 
 
 def _route_from_decision(decision: EvaluationDecision) -> RouteTarget:
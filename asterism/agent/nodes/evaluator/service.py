@@ -101,7 +101,13 @@ def _handle_continue_decision(state: AgentState, llm: BaseLLMProvider) -> AgentS
     resolved_input, resolver_usage = resolve_next_task_inputs(llm, next_task, state)
 
     if resolved_input is not None:
-        next_task.tool_input = resolved_input
+        # Replace the plan instead of editing the task in place: the incoming plan
+        # belongs to the previous state, and graph nodes only report fields whose
+        # value was replaced
+        plan = state["plan"]
+        tasks = list(plan.tasks)
+        tasks[state.get("current_task_index", 0)] = next_task.model_copy(update={"tool_input": resolved_input})
+        state["plan"] = plan.model_copy(update={"tasks": tasks})
         logger.info(f"Resolved inputs for task {next_task.id}: {resolved_input}")
 
     if resolver_usage:
@@ -1,5 +1,7 @@
 """LLM task execution runner."""
 
+from concurrent.futures import ThreadPoolExecutor
+
 from langchain_core.messages import HumanMessage, SystemMessage
 
 from asterism.agent.models import TaskResult
@@ -11,6 +13,9 @@ from asterism.llm.providers import BaseLLMProvider
 LLM_TASK_SYSTEM_PROMPT = """You are a helpful assistant executing a specific task.
 Follow the instructions carefully and provide a clear, concise response."""
 
+# Upper bound on concurrent LLM requests issued for one batch of independent tasks
+MAX_BATCH_CONCURRENCY = 10
+
 
 class LLMRunner:
     """Runner for LLM-only execution tasks."""
@@ -57,6 +62,26 @@ class LLMRunner:
                 error=str(e),
             )
 
+    def execute_batch(self, tasks: list, state: AgentState) -> list[TaskResult]:
+        """Execute independent LLM-only tasks concurrently.
+
+        The tasks must not depend on each other; each one sees the same
+        state. Requests run on a bounded thread pool, so the batch costs
+        roughly one LLM round trip instead of one per task.
+
+        Args:
+            tasks: Tasks whose dependencies are already satisfied.
+            state: Current agent state for context.
+
+        Returns:
+            One TaskResult per task, in task order.
+        """
+        if len(tasks) <= 1:
+            return [self.execute(task, state) for task in tasks]
+
+        with ThreadPoolExecutor(max_workers=min(len(tasks), MAX_BATCH_CONCURRENCY)) as pool:
+            return list(pool.map(lambda task: self.execute(task, state), tasks))
+
     def _build_context(self, task, state: AgentState) -> str:
         """Build execution context from dependent task results.
 
@@ -1,5 +1,6 @@
 """MCP tool execution runner."""
 
+import reprlib
 import time
 from dataclasses import dataclass
 from typing import Any
@@ -10,6 +11,10 @@ from asterism.agent.state import AgentState
 from asterism.agent.utils import log_mcp_tool_call
 from asterism.mcp.executor import MCPExecutor
 
+# Bounded repr for log previews, so large results are never stringified whole
+_PREVIEW_CHARS = 500
+_preview_repr = reprlib.Repr(maxlevel=3, maxdict=10, maxlist=10, maxstring=_PREVIEW_CHARS, maxother=_PREVIEW_CHARS)
+
 
 @dataclass
 class MCPResult:
@@ -19,6 +24,7 @@ class MCPResult:
     data: Any
     error: str | None
     duration_ms: float
+    truncated: bool = False
 
 
 class MCPRunner:
@@ -50,8 +56,54 @@ class MCPRunner:
             success=mcp_result.success,
             result=mcp_result.data if mcp_result.success else None,
             error=mcp_result.error if not mcp_result.success else None,
+            truncated=mcp_result.truncated,
         )
 
+    def execute_batch(self, tasks: list, state: AgentState) -> list[TaskResult]:
+        """Execute independent MCP tool call tasks in one batch.
+
+        Args:
+            tasks: Tasks with tool_call and tool_input whose dependencies are satisfied.
+            state: Current agent state (unused for MCP tasks).
+
+        Returns:
+            One TaskResult per task, in task order.
+        """
+        calls = []
+        for task in tasks:
+            server_name, tool_name = parse_tool_call(task.tool_call)
+            calls.append((server_name, tool_name, task.tool_input or {}))
+
+        start_time = time.perf_counter()
+        results = self.executor.execute_tools_batch(calls)
+        duration_ms = (time.perf_counter() - start_time) * 1000
+
+        task_results = []
+        for task, (server_name, tool_name, tool_input), result in zip(tasks, calls, results, strict=True):
+            success = result.get("success", False)
+
+            # Calls overlap, so each one is logged with the duration of the whole batch
+            self._log_result(
+                server_name=server_name,
+                tool_name=tool_name,
+                tool_input=tool_input,
+                success=success,
+                duration_ms=duration_ms,
+                result=result,
+            )
+
+            task_results.append(
+                TaskResult(
+                    task_id=task.id,
+                    success=success,
+                    result=result.get("result") if success else None,
+                    error=result.get("error") if not success else None,
+                    truncated=result.get("truncated", False),
+                )
+            )
+
+        return task_results
+
     def _execute_tool(
         self,
         server_name: str,
@@ -92,6 +144,7 @@ class MCPRunner:
                 data=result.get("result") if success else None,
                 error=result.get("error") if not success else None,
                 duration_ms=duration_ms,
+                truncated=result.get("truncated", False),
             )
 
         except Exception as e:
@@ -131,6 +184,13 @@ class MCPRunner:
             input_keys=list(tool_input.keys()),
             success=success,
             duration_ms=duration_ms,
-            result_preview=str(result.get("result", ""))[:500] if result else None,
+            result_preview=_result_preview(result.get("result", "")) if result else None,
             error=error,
         )
+
+
+def _result_preview(value: Any) -> str:
+    """Build a short log preview of a tool result without stringifying all of it."""
+    if isinstance(value, str):
+        return value[:_PREVIEW_CHARS]
+    return _preview_repr.repr(value)[:_PREVIEW_CHARS]
@@ -1,12 +1,16 @@
 """Executor node implementation - executes tasks in the plan."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
+from asterism.agent.nodes.executor.llm_runner import LLMRunner
+from asterism.agent.nodes.executor.mcp_runner import MCPRunner
 from asterism.agent.nodes.executor.task_runner import create_task_runner
 from asterism.agent.nodes.shared import (
     advance_task,
     are_dependencies_satisfied,
     create_error_state,
+    get_completed_task_ids,
     get_current_task,
     is_linear_plan,
 )
@@ -68,6 +72,7 @@ def _execute_linear_plan(
     # plan = state.get("plan")
     current_state = state
     executed_count = 0
+    completed_ids = get_completed_task_ids(state)
 
     while True:
         task = get_current_task(current_state)
@@ -76,7 +81,7 @@ def _execute_linear_plan(
             # No more tasks to execute
             break
 
-        if not are_dependencies_satisfied(task, current_state):
+        if not are_dependencies_satisfied(task, current_state, completed_ids):
             deps = [d for d in task.depends_on]
             return create_error_state(current_state, f"Dependencies not satisfied: {deps}")
 
@@ -90,6 +95,7 @@ def _execute_linear_plan(
 
         # Advance to next task
         current_state = advance_task(current_state, result)
+        completed_ids.add(result.task_id)
 
         # Stop batch execution if task failed
         if not result.success:
@@ -107,7 +113,10 @@ def _execute_single_task(
     mcp_executor: MCPExecutor,
     state: AgentState,
 ) -> AgentState:
-    """Execute a single task (standard mode for non-linear plans).
+    """Execute the current task (standard mode for non-linear plans).
+
+    Independent tasks that are ready alongside the current one are executed
+    with it in a single concurrent batch.
 
     Args:
         llm: The LLM provider for LLM-only tasks.
@@ -126,6 +135,10 @@ def _execute_single_task(
         deps = [d for d in task.depends_on]
         return create_error_state(state, f"Dependencies not satisfied: {deps}")
 
+    ready_tasks = _collect_ready_tasks(state)
+    if len(ready_tasks) > 1:
+        return _execute_ready_batch(llm, mcp_executor, ready_tasks, state)
+
     logger.info(f"[executor] Starting task {task.id}: {task.description[:80]}")
 
     runner = create_task_runner(task, llm, mcp_executor)
@@ -136,6 +149,94 @@ def _execute_single_task(
     return advance_task(state, result)
 
 
+def _collect_ready_tasks(state: AgentState) -> list:
+    """Collect consecutive tasks, starting at the current one, that can run together.
+
+    A task is ready when every dependency has already completed, which also
+    rules out dependencies on other tasks in the same batch. Only the current
+    task has had its tool inputs resolved by the evaluator, so later tool
+    tasks join the batch only when they do not depend on earlier results.
+
+    Args:
+        state: Current agent state.
+
+    Returns:
+        List of ready tasks in plan order (may be empty).
+    """
+    plan = state.get("plan")
+    if not plan:
+        return []
+
+    completed_ids = get_completed_task_ids(state)
+    ready = []
+    for task in plan.tasks[state.get("current_task_index", 0) :]:
+        if not are_dependencies_satisfied(task, state, completed_ids):
+            break
+        if ready and task.tool_call and task.depends_on:
+            break
+        ready.append(task)
+    return ready
+
+
+def _execute_ready_batch(
+    llm: BaseLLMProvider,
+    mcp_executor: MCPExecutor,
+    tasks: list,
+    state: AgentState,
+) -> AgentState:
+    """Execute independent tasks concurrently and record their results in plan order.
+
+    Tool calls go out as one MCP batch next to the LLM batch, so the whole
+    batch costs roughly its slowest round trip. A pool is only used when
+    both kinds of task are present.
+
+    Results are recorded in plan order up to and including the first
+    failure, so the evaluator sees the failure before any later task is
+    advanced past. Tasks after the failure have already run, but their
+    results are discarded and they stay pending.
+
+    Args:
+        llm: The LLM provider for LLM-only tasks.
+        mcp_executor: The MCP executor for tool calls.
+        tasks: Ready tasks starting at the current task index.
+        state: Current agent state.
+
+    Returns:
+        Updated state with all execution results.
+    """
+    logger.info(f"[executor] Starting {len(tasks)} independent tasks concurrently")
+
+    tool_tasks = [task for task in tasks if task.tool_call]
+    llm_tasks = [task for task in tasks if not task.tool_call]
+
+    if tool_tasks and llm_tasks:
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            tool_future = pool.submit(MCPRunner(mcp_executor).execute_batch, tool_tasks, state)
+            llm_future = pool.submit(LLMRunner(llm).execute_batch, llm_tasks, state)
+            tool_results, llm_results = tool_future.result(), llm_future.result()
+    else:
+        tool_results = MCPRunner(mcp_executor).execute_batch(tool_tasks, state) if tool_tasks else []
+        llm_results = LLMRunner(llm).execute_batch(llm_tasks, state) if llm_tasks else []
+
+    tool_iter, llm_iter = iter(tool_results), iter(llm_results)
+    results = [next(tool_iter) if task.tool_call else next(llm_iter) for task in tasks]
+
+    current_state = state
+    for position, (task, result) in enumerate(zip(tasks, results, strict=True)):
+        log_task_completion(task.id, result.success)
+        current_state = advance_task(current_state, result)
+
+        # Hand a failure to the evaluator before recording anything after it, as
+        # linear plans do; later tasks stay pending and run again if the plan continues
+        if not result.success:
+            skipped = len(tasks) - position - 1
+            if skipped:
+                logger.info(f"[executor] Stopping batch at failed task {task.id}, discarding {skipped} later results")
+            break
+
+    return current_state
+
+
 def log_task_completion(task_id: str, success: bool) -> None:
     """Log task completion status."""
     if success:
@@ -1,9 +1,15 @@
 """Utility functions for the executor module."""
 
+from functools import lru_cache
 
+
+@lru_cache(maxsize=256)
 def parse_tool_call(tool_call: str) -> tuple[str, str]:
     """Parse tool call string into server and tool names.
 
+    Plans draw tool calls from a small fixed set of strings, so parsed
+    results are memoized.
+
     Args:
         tool_call: Tool call string in format "server:tool".
 
@@ -13,8 +19,8 @@ def parse_tool_call(tool_call: str) -> tuple[str, str]:
     Raises:
         ValueError: If format is invalid.
     """
-    if ":" not in tool_call:
+    server_name, separator, tool_name = tool_call.partition(":")
+    if not separator:
         raise ValueError(f"Invalid tool_call format: {tool_call}. Expected 'server:tool'")
 
-    server_name, tool_name = tool_call.split(":", 1)
     return server_name, tool_name
@@ -0,0 +1,73 @@
+"""Plan cache for repeated planning requests.
+
+Planning is a single LLM round trip whose output depends only on the user
+request, the available tools, the workspace tree, the model and the planner
+prompt. When all of them repeat, the previously validated plan is reused
+instead of asking the LLM again. Caching is switched on with the
+``planner.plan_cache`` setting in config.yaml.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+from asterism.agent.models import Plan
+
+_DEFAULT_MAX_SIZE = 128
+
+
+class PlanCache:
+    """Thread-safe LRU cache of validated plans keyed by planning inputs."""
+
+    def __init__(self, max_size: int = _DEFAULT_MAX_SIZE):
+        self._max_size = max_size
+        self._entries: OrderedDict[str, Plan] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(user_message: str, tools_context: str, workspace_context: str, model: str, prompt: str) -> str:
+        """Build a cache key from the inputs that determine a plan.
+
+        Only whitespace in the user message is normalized. Case is kept because
+        paths and identifiers in a request are case-sensitive.
+        """
+        objective = " ".join(user_message.split())
+        digest = hashlib.sha256()
+        for part in (objective, tools_context, workspace_context, model, prompt):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Plan | None:
+        """Return a copy of the cached plan for key, or None on a miss."""
+        with self._lock:
+            plan = self._entries.get(key)
+            if plan is None:
+                return None
+            self._entries.move_to_end(key)
+        # Callers may enrich or mutate the plan, so never hand out the cached instance
+        return plan.model_copy(deep=True)
+
+    def put(self, key: str, plan: Plan) -> None:
+        """Store a copy of plan under key, evicting the least recently used entry."""
+        with self._lock:
+            self._entries[key] = plan.model_copy(deep=True)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached plans."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_plan_cache = PlanCache()
+
+
+def get_plan_cache() -> PlanCache:
+    """Get the process-wide plan cache."""
+    return _plan_cache
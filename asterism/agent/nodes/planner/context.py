@@ -131,10 +131,14 @@ JSON OUTPUT:"""
 
 
 def _build_system_prompt(tools_context: str, workspace_context: str) -> str:
-    """Build the enhanced system prompt with context."""
-    return f"""{PLANNER_SYSTEM_PROMPT}
+    """Build the enhanced system prompt with context.
 
-{workspace_context}
+    Sections are ordered from most to least stable: the tool list only changes
+    when MCP servers change, while the workspace tree changes whenever a task
+    writes a file. Keeping the stable text first gives provider-side prompt
+    caches the longest identical prefix across planning calls.
+    """
+    return f"""{PLANNER_SYSTEM_PROMPT}
 
 Available MCP Tools:
 {tools_context}
@@ -144,4 +148,6 @@ When creating tasks with tool calls:
 - Use exact format: "server_name:tool_name"
 - Provide all required parameters in tool_input
 - If a tool is not available, use LLM reasoning instead
+
+{workspace_context}
 """
@@ -2,8 +2,10 @@
 
 import logging
 
-from asterism.agent.models import Plan
+from asterism.agent.models import LLMUsage, Plan
+from asterism.agent.nodes.planner.cache import PlanCache, get_plan_cache
 from asterism.agent.nodes.planner.context import build_planner_context
+from asterism.agent.nodes.planner.prompts import PLANNER_SYSTEM_PROMPT
 from asterism.agent.nodes.planner.service import (
     PlanningError,
     log_plan_creation,
@@ -26,6 +28,7 @@ def planner_node(
     mcp_executor: MCPExecutor,
     state: AgentState,
     workspace_root: str = "./workspace",
+    plan_cache_enabled: bool = False,
 ) -> AgentState:
     """Create or update a plan based on user request and execution history.
 
@@ -34,6 +37,7 @@ def planner_node(
         mcp_executor: The MCP executor for tool discovery.
         state: Current agent state.
         workspace_root: Path to workspace for context.
+        plan_cache_enabled: Whether initial plans may be served from the plan cache.
 
     Returns:
         Updated state with new plan.
@@ -43,11 +47,28 @@ def planner_node(
     context = build_planner_context(state, mcp_executor, workspace_root)
     caller = LLMCaller(llm, "planner_node")
 
+    # Only initial plans are cached; replans depend on execution history
+    cache_key = None
+    if plan_cache_enabled and not state.get("execution_results"):
+        cache_key = PlanCache.make_key(
+            context.user_message, context.tools_context, context.workspace_context, llm.model, PLANNER_SYSTEM_PROMPT
+        )
+        cached_plan = get_plan_cache().get(cache_key)
+        if cached_plan is not None:
+            logger.info(f"[planner] Reusing cached plan with {len(cached_plan.tasks)} tasks")
+            usage = LLMUsage(
+                prompt_tokens=0, completion_tokens=0, total_tokens=0, model=llm.model, node_name="planner_node"
+            )
+            return set_plan(state, cached_plan, usage)
+
     try:
         result = caller.call_structured(context.messages, Plan, "creating plan")
         plan = validate_and_enrich_plan(result.parsed)
         log_plan_creation(plan)
 
+        if cache_key is not None:
+            get_plan_cache().put(cache_key, plan)
+
         logger.info(f"[planner] Created plan with {len(plan.tasks)} tasks")
         return set_plan(state, plan, result.usage)
 
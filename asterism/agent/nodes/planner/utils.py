@@ -8,11 +8,42 @@ def generate_task_id(index: int, description: str) -> str:
     return f"task_{index}_{description.lower().replace(' ', '_')[:30]}"
 
 
+# Last formatted tools context, keyed by the schema lists it was built from.
+# MCPExecutor hands out the same cached list per server on every call, and
+# holding references to them keeps the identity comparison sound.
+_tools_context_cache: tuple[tuple[tuple[str, list], ...], str] | None = None
+
+
 def format_tools_context(tool_schemas: dict[str, list[dict[str, Any]]]) -> str:
-    """Format tool schemas for inclusion in LLM prompt."""
+    """Format tool schemas for inclusion in LLM prompt.
+
+    The result is reused while the executor keeps returning the same schema
+    lists, so repeated planning calls skip the per-tool formatting.
+    """
+    global _tools_context_cache
     if not tool_schemas:
         return "No MCP tools available."
 
+    key = tuple(tool_schemas.items())
+    cached = _tools_context_cache
+    if cached is not None and _same_schemas(cached[0], key):
+        return cached[1]
+
+    context = _format_tools(tool_schemas)
+    _tools_context_cache = (key, context)
+    return context
+
+
+def _same_schemas(cached: tuple[tuple[str, list], ...], current: tuple[tuple[str, list], ...]) -> bool:
+    """Check whether two schema snapshots hold the same lists under the same server names."""
+    return len(cached) == len(current) and all(
+        cached_name == name and cached_tools is tools
+        for (cached_name, cached_tools), (name, tools) in zip(cached, current, strict=True)
+    )
+
+
+def _format_tools(tool_schemas: dict[str, list[dict[str, Any]]]) -> str:
+    """Render tool schemas as the markdown tool list shown to the planner."""
     lines = []
     for server_name, tools in tool_schemas.items():
         if not tools:
@@ -11,6 +11,7 @@ This module provides cross-cutting concerns used across all nodes:
 from .context_extractors import (
     are_dependencies_satisfied,
     format_execution_history,
+    get_completed_task_ids,
     get_current_task,
     get_failed_tasks,
     get_last_result,
@@ -47,6 +48,7 @@ __all__ = [
     "has_execution_history",
     "get_current_task",
     "get_failed_tasks",
+    "get_completed_task_ids",
     "are_dependencies_satisfied",
     # State Utils
     "create_error_state",
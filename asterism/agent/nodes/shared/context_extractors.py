@@ -120,12 +120,14 @@ def get_completed_task_ids(state: AgentState) -> set[str]:
     return {result.task_id for result in results}
 
 
-def are_dependencies_satisfied(task, state: AgentState) -> bool:
+def are_dependencies_satisfied(task, state: AgentState, completed_ids: set[str] | None = None) -> bool:
     """Check if all dependencies for a task are satisfied.
 
     Args:
         task: The task to check.
         state: Current agent state.
+        completed_ids: Precomputed result of get_completed_task_ids(state), so
+            callers checking many tasks scan the execution history only once.
 
     Returns:
         True if all dependencies are satisfied, False otherwise.
@@ -133,7 +135,8 @@ def are_dependencies_satisfied(task, state: AgentState) -> bool:
     if not task.depends_on:
         return True
 
-    completed_ids = get_completed_task_ids(state)
+    if completed_ids is None:
+        completed_ids = get_completed_task_ids(state)
     return all(dep in completed_ids for dep in task.depends_on)
 
 
@@ -87,7 +87,7 @@ class LLMCaller:
                 completion_tokens=response.completion_tokens,
                 duration_ms=duration_ms,
                 prompt_preview=prompt_preview,
-                response_preview=str(response.parsed.model_dump())[:500] if response.parsed else None,
+                response_preview=response.parsed.model_dump_json()[:500] if response.parsed else None,
                 success=True,
             )
 
@@ -1,5 +1,7 @@
 """Workspace directory tree generator for agent prompts."""
 
+import os
+from functools import lru_cache
 from pathlib import Path
 
 # Default ignore patterns for common directories/files
@@ -42,23 +44,23 @@ DEFAULT_MAX_DEPTH = 3
 DEFAULT_MAX_FILES = 20
 
 
+@lru_cache(maxsize=8)
+def _wildcard_suffixes(ignore_patterns: frozenset[str]) -> tuple[str, ...]:
+    """Collect the suffixes of the '*'-prefixed patterns in ignore_patterns."""
+    return tuple(pattern[1:] for pattern in ignore_patterns if pattern.startswith("*"))
+
+
 def _should_ignore(name: str, ignore_patterns: frozenset[str]) -> bool:
     """Check if a file/directory should be ignored."""
-    # Check exact match
-    if name in ignore_patterns:
-        return True
-    # Check wildcard patterns
-    for pattern in ignore_patterns:
-        if pattern.startswith("*") and name.endswith(pattern[1:]):
-            return True
-    return False
+    # Check exact match, then all wildcard suffixes in a single endswith call
+    return name in ignore_patterns or name.endswith(_wildcard_suffixes(ignore_patterns))
 
 
 def generate_workspace_tree(
     workspace_root: str | Path,
     max_depth: int = DEFAULT_MAX_DEPTH,
     max_files: int = DEFAULT_MAX_FILES,
-    ignore_patterns: frozenset[str] | None = None,
+    ignore_patterns: set[str] | frozenset[str] | None = None,
 ) -> str:
     """Generate a directory tree string for the workspace.
 
@@ -80,17 +82,31 @@ def generate_workspace_tree(
     if not root_path.is_dir():
         return f"# Workspace Directory: {root_path}\n(Not a directory)"
 
-    ignores = ignore_patterns if ignore_patterns is not None else DEFAULT_IGNORE_PATTERNS
+    # The wildcard suffixes are cached per pattern set, which must be hashable
+    ignores = frozenset(ignore_patterns) if ignore_patterns is not None else DEFAULT_IGNORE_PATTERNS
 
     lines: list[str] = [f"# Workspace Directory: {root_path}", ""]
 
-    def _build_tree(current_path: Path, prefix: str = "", current_depth: int = 0) -> None:
+    def _build_tree(current_path: str | Path, prefix: str = "", current_depth: int = 0) -> None:
         """Recursively build the tree structure."""
         if current_depth > max_depth:
             return
 
+        # Separate directories and files, filtering ignored items. scandir
+        # entries carry their file type from the directory read, so telling
+        # the two apart needs no extra stat per entry on most filesystems.
+        dirs: list[os.DirEntry] = []
+        files: list[os.DirEntry] = []
+
         try:
-            entries = list(current_path.iterdir())
+            with os.scandir(current_path) as entries:
+                for entry in entries:
+                    if _should_ignore(entry.name, ignores):
+                        continue
+                    if entry.is_dir():
+                        dirs.append(entry)
+                    else:
+                        files.append(entry)
         except PermissionError:
             lines.append(f"{prefix}[Permission Denied]")
             return
@@ -98,46 +114,34 @@ def generate_workspace_tree(
             lines.append(f"{prefix}[Error reading directory]")
             return
 
-        # Separate directories and files, filtering ignored items
-        dirs: list[Path] = []
-        files: list[Path] = []
-
-        for entry in entries:
-            if _should_ignore(entry.name, ignores):
-                continue
-            if entry.is_dir():
-                dirs.append(entry)
-            else:
-                files.append(entry)
-
         # Sort alphabetically
-        dirs.sort(key=lambda p: p.name.lower())
-        files.sort(key=lambda p: p.name.lower())
+        dirs.sort(key=lambda e: e.name.lower())
+        files.sort(key=lambda e: e.name.lower())
 
-        # Combine and check total count
-        all_entries = dirs + files
-        total_count = len(all_entries)
+        # Check total count
+        total_count = len(dirs) + len(files)
         show_truncated = total_count > max_files
 
         if show_truncated:
             # Show only directories when truncated
-            display_entries = dirs
             lines.append(f"{prefix}... ({total_count} items total, showing {len(dirs)} directories)")
-        else:
-            display_entries = all_entries
 
-        # Process entries
-        for i, entry in enumerate(display_entries):
-            is_last = (i == len(display_entries) - 1) and not show_truncated
+        display_count = len(dirs) if show_truncated else total_count
+
+        # Process directories, then files
+        for i, entry in enumerate(dirs):
+            is_last = i == display_count - 1 and not show_truncated
             connector = "└── " if is_last else "├── "
-            next_prefix = prefix + ("    " if is_last else "│   ")
-
-            if entry.is_dir():
-                lines.append(f"{prefix}{connector}{entry.name}/")
-                if current_depth < max_depth:
-                    _build_tree(entry, next_prefix, current_depth + 1)
-            else:
-                lines.append(f"{prefix}{connector}{entry.name}")
+            lines.append(f"{prefix}{connector}{entry.name}/")
+            if current_depth < max_depth:
+                _build_tree(entry.path, prefix + ("    " if is_last else "│   "), current_depth + 1)
+
+        if show_truncated:
+            return
+
+        for i, entry in enumerate(files, start=len(dirs)):
+            connector = "└── " if i == display_count - 1 else "├── "
+            lines.append(f"{prefix}{connector}{entry.name}")
 
     # Start building from root
     lines.append(f"{root_path.name}/")
@@ -1,5 +1,6 @@
 """Agent lifecycle management service."""
 
+import asyncio
 import logging
 from typing import Any
 
@@ -59,6 +60,7 @@ class AgentService:
             mcp_executor=self.mcp_executor,
             db_path=None,  # Disable checkpointing for API requests
             workspace_root=self.config.workspace_path,
+            plan_cache_enabled=self.config.data.planner.plan_cache,
         )
 
         try:
@@ -70,8 +72,10 @@ class AgentService:
                 # The router will handle model resolution
                 pass
 
-            # Run agent with full conversation context
-            result = agent.invoke(
+            # Run agent with full conversation context on a worker thread so
+            # its blocking LLM and MCP calls do not stall the event loop
+            result = await asyncio.to_thread(
+                agent.invoke,
                 session_id=request_id,
                 messages=messages,
             )
@@ -101,6 +105,7 @@ class AgentService:
             mcp_executor=self.mcp_executor,
             db_path=None,  # Disable checkpointing for API requests
             workspace_root=self.config.workspace_path,
+            plan_cache_enabled=self.config.data.planner.plan_cache,
         )
 
         try:
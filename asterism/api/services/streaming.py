@@ -1,6 +1,5 @@
 """SSE streaming implementation for chat completions."""
 
-import json
 import time
 from collections.abc import AsyncGenerator
 
@@ -42,7 +41,7 @@ async def stream_chat_completion(
             )
         ],
     )
-    yield f"data: {json.dumps(start_chunk.model_dump())}\n\n"
+    yield f"data: {start_chunk.model_dump_json()}\n\n"
 
     # Stream content tokens
     full_content = ""
@@ -61,7 +60,7 @@ async def stream_chat_completion(
                     )
                 ],
             )
-            yield f"data: {json.dumps(finish_chunk.model_dump())}\n\n"
+            yield f"data: {finish_chunk.model_dump_json()}\n\n"
             yield "data: [DONE]\n\n"
             break
         else:
@@ -79,4 +78,4 @@ async def stream_chat_completion(
                     )
                 ],
             )
-            yield f"data: {json.dumps(content_chunk.model_dump())}\n\n"
+            yield f"data: {content_chunk.model_dump_json()}\n\n"
@@ -8,6 +8,7 @@ from .config import (
     MCPConfig,
     ModelProvider,
     ModelsConfig,
+    PlannerConfig,
 )
 
 __all__ = [
@@ -18,4 +19,5 @@ __all__ = [
     "MCPConfig",
     "ModelProvider",
     "ModelsConfig",
+    "PlannerConfig",
 ]
@@ -49,6 +49,9 @@ logging.basicConfig(
     handlers=log_handlers,
 )
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class AgentConfig(BaseModel):
     """Agent metadata configuration."""
@@ -92,6 +95,12 @@ class MCPConfig(BaseModel):
     timeout: int = Field(default=30, description="MCP server timeout in seconds")
 
 
+class PlannerConfig(BaseModel):
+    """Planner configuration."""
+
+    plan_cache: bool = Field(default=False, description="Reuse plans for repeated initial requests")
+
+
 class ConfigData(BaseModel):
     """Complete configuration data structure."""
 
@@ -99,6 +108,7 @@ class ConfigData(BaseModel):
     api: APIConfig = Field(..., description="API configuration")
     models: ModelsConfig = Field(..., description="Models configuration")
     mcp: MCPConfig = Field(default_factory=MCPConfig, description="MCP configuration")
+    planner: PlannerConfig = Field(default_factory=PlannerConfig, description="Planner configuration")
 
 
 class Config:
@@ -178,7 +188,7 @@ class Config:
             raise FileNotFoundError(f"Configuration file not found: {self._config_file}")
 
         with open(self._config_file, encoding="utf-8") as f:
-            self._raw_config = yaml.safe_load(f) or {}
+            self._raw_config = yaml.load(f, Loader=_YAML_LOADER) or {}
 
         # Resolve environment variables in the raw config
         resolved_config = self._resolve_env_values(self._raw_config)
@@ -4,7 +4,8 @@ This module provides functionality to load and combine system prompts
 from markdown files. SOUL.md contains the agent's core values and philosophy,
 while AGENT.md contains the agent's identity and capabilities.
 
-These files are read fresh on each call to ensure runtime updates are reflected.
+These files are checked on each call to ensure runtime updates are reflected;
+unchanged files are served from memory instead of being re-read.
 """
 
 from pathlib import Path
@@ -14,9 +15,10 @@ from typing import Self
 class SystemPromptLoader:
     """Loads SOUL.md and AGENT.md from disk and combines them.
 
-    This loader reads both files fresh on each call, ensuring that any
-    runtime updates to these files are immediately reflected in the
-    agent's behavior.
+    This loader stats both files on each call, ensuring that any runtime
+    updates to these files are immediately reflected in the agent's
+    behavior. A file is only re-read when its modification time or size
+    changes.
 
     Attributes:
         soul_path: Path to the SOUL.md file (default: workspace/SOUL.md)
@@ -42,6 +44,7 @@ class SystemPromptLoader:
         self.soul_path = soul_path or self.DEFAULT_SOUL_PATH
         self.agent_path = agent_path or self.DEFAULT_AGENT_PATH
         self.agent_personality = agent_path or self.DEFAULT_PERSONALITY_PATH
+        self._file_cache: dict[Path, tuple[tuple[int, int, int], str]] = {}
 
     def with_paths(self, soul_path: str, agent_path: str) -> Self:
         """
@@ -82,15 +85,25 @@ class SystemPromptLoader:
                 # Fallback to current directory
                 file_path = current / path
 
+        # Providers call load() on every LLM request; a stat is far cheaper than a read
+        stat = file_path.stat()
+        signature = (stat.st_mtime_ns, stat.st_ctime_ns, stat.st_size)
+        cached = self._file_cache.get(file_path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
         with open(file_path, encoding="utf-8") as f:
-            return f.read()
+            content = f.read()
+        self._file_cache[file_path] = (signature, content)
+        return content
 
     def load(self) -> str:
         """
         Load and combine SOUL.md and AGENT.md content.
 
-        Reads both files fresh from disk and combines them with
-        a separator. This ensures runtime updates are reflected.
+        Checks both files on disk and combines them with a separator,
+        re-reading any that changed. This ensures runtime updates are
+        reflected.
 
         Returns:
             Combined system prompt string from both files.
@@ -227,14 +227,13 @@ class LLMProviderRouter(BaseLLMProvider):
         Returns:
             Tuple of (provider_name, model_name)
         """
-        if "/" in model_string:
-            parts = model_string.split("/", 1)
-            return parts[0], parts[1]
+        provider_name, separator, model_name = model_string.partition("/")
+        if separator:
+            return provider_name, model_name
 
         # No provider prefix, use default provider from config
-        default_model = self.config.data.models.default
-        if "/" in default_model:
-            default_provider = default_model.split("/", 1)[0]
+        default_provider, separator, _ = self.config.data.models.default.partition("/")
+        if separator:
             return default_provider, model_string
 
         # Default model also has no provider, use model string as-is
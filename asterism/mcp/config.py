@@ -10,6 +10,9 @@ from typing import Any
 
 MCP_SERVERS_KEY = "mcpServers"
 
+# Default location in the project root config directory
+_DEFAULT_CONFIG_PATH = Path(__file__).resolve().parents[2] / "config" / "mcp_servers.json"
+
 
 class MCPConfig:
     """MCP server configuration manager."""
@@ -21,11 +24,7 @@ class MCPConfig:
         Args:
             config_path: Path to the MCP configuration file. If None, uses default location.
         """
-        if config_path is None:
-            # Use the project root config directory
-            config_path = Path(__file__).parent.parent.parent / "config" / "mcp_servers.json"
-
-        self.config_path = Path(config_path)
+        self.config_path = _DEFAULT_CONFIG_PATH if config_path is None else Path(config_path)
         self._config: dict[str, Any] | None = None
 
     def load_config(self) -> dict[str, Any]:
@@ -5,7 +5,10 @@ configuration, replacing the hardcoded implementations in the executor node.
 """
 
 import logging
+import threading
+import time
 from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from typing import Any
 
@@ -14,16 +17,36 @@ from asterism.mcp.transport_executor.base import BaseTransport
 from .config import MCPConfig, get_mcp_config
 from .transport_executor import create_transport
 
+# Strings in tool results longer than this are cut before they enter agent
+# state, where they would be copied into prompts and checkpoints on every step
+DEFAULT_MAX_RESULT_CHARS = 65536
+
+# Statuses for calls a server turned away without running them: a conflicting
+# request in flight (409), rate limiting (429) or overload (503). Only these are
+# resent one by one; any other failure may come after the tool already acted.
+_RESEND_ERROR_PREFIXES = ("HTTP error 409:", "HTTP error 429:", "HTTP error 503:")
+
+# Wait before resending rejected calls when the server sends no Retry-After,
+# and the longest Retry-After honoured
+_RESEND_DELAY_SECONDS = 0.5
+_MAX_RESEND_DELAY_SECONDS = 30.0
+
 
 class MCPExecutor:
     """Dynamic MCP tool executor that uses configuration-based tool routing."""
 
-    def __init__(self, config_path: str | MCPConfig | None = None):
+    def __init__(
+        self,
+        config_path: str | MCPConfig | None = None,
+        max_result_chars: int | None = DEFAULT_MAX_RESULT_CHARS,
+    ):
         """
         Initialize the MCP executor.
 
         Args:
             config_path: Path to the MCP configuration file. If None, uses default location.
+            max_result_chars: Maximum length of any string in a tool result. Longer
+                strings are cut, while dicts and lists keep their shape. None disables the limit.
         """
         if isinstance(config_path, str):
             self.config = MCPConfig(config_path)
@@ -36,12 +59,22 @@ class MCPExecutor:
         self.transports: dict[str, BaseTransport | None] = {}
         self.tool_cache: dict[str, list] = {}
         self.tool_schema_cache: dict[str, list[dict[str, Any]]] = {}
+        self.max_result_chars = max_result_chars
+        # Concurrent agent runs share this executor; only one of them may start a server
+        self._transport_lock = threading.Lock()
 
         self._log = logging.getLogger(self.__class__.__name__)
 
     def _get_transport(self, server_name: str) -> BaseTransport:
         """Get or create transport for a server."""
-        if server_name not in self.transports:
+        if server_name in self.transports:
+            return self.transports[server_name]
+
+        with self._transport_lock:
+            # Another thread may have started the server while this one waited
+            if server_name in self.transports:
+                return self.transports[server_name]
+
             metadata = self.config.get_server_metadata(server_name)
             if not metadata:
                 raise ValueError(f"No metadata found for server: {server_name}")
@@ -52,11 +85,11 @@ class MCPExecutor:
                 transport.start(metadata["command"], metadata["args"], cwd)
             else:
                 transport.start(metadata["command"], metadata["args"])
-            self.transports[server_name] = transport
 
-            # Cache tools for this server
+            # Cache tools before publishing the transport, so readers never see it without its tool list
             self.tool_cache[server_name] = transport.list_tools()
-        return self.transports[server_name]
+            self.transports[server_name] = transport
+        return transport
 
     def execute_tool(self, server_name: str, tool_name: str, **kwargs) -> dict[str, Any]:
         """
@@ -74,47 +107,139 @@ class MCPExecutor:
                 - error: Error message if failed, None if succeeded
                 - tool: The tool identifier used
                 - tool_call: The original tool call string
+                - truncated: Present and True when a string in the result was
+                  longer than max_result_chars and was cut to a prefix
         """
         try:
             # Validate server is enabled
             if not self.config.is_server_enabled(server_name):
-                return {
-                    "success": False,
-                    "error": f"MCP server '{server_name}' is not enabled",
-                    "result": None,
-                    "tool": f"{server_name}:{tool_name}",
-                    "tool_call": f"{server_name}:{tool_name}",
-                }
+                return self._tool_error(server_name, tool_name, f"MCP server '{server_name}' is not enabled")
 
             # Get transport and validate tool
             transport = self._get_transport(server_name)
             if tool_name not in self.tool_cache.get(server_name, []):
-                return {
-                    "success": False,
-                    "error": f"Tool '{tool_name}' not found on server '{server_name}'",
-                    "result": None,
-                    "tool": f"{server_name}:{tool_name}",
-                    "tool_call": f"{server_name}:{tool_name}",
-                }
+                return self._tool_error(
+                    server_name, tool_name, f"Tool '{tool_name}' not found on server '{server_name}'"
+                )
 
             # Execute the tool via transport
             result = transport.execute_tool(tool_name, **kwargs)
-            return {
-                "success": True,
-                "result": result,
-                "error": None,
-                "tool": f"{server_name}:{tool_name}",
-                "tool_call": f"{server_name}:{tool_name}",
-            }
+            return self._tool_success(server_name, tool_name, result)
 
         except Exception as e:
-            return {
-                "success": False,
-                "error": f"Error executing tool: {str(e)}",
-                "result": None,
-                "tool": f"{server_name}:{tool_name}",
-                "tool_call": f"{server_name}:{tool_name}",
-            }
+            return self._tool_error(server_name, tool_name, f"Error executing tool: {str(e)}")
+
+    def execute_tools_batch(self, calls: list[tuple[str, str, dict[str, Any]]]) -> list[dict[str, Any]]:
+        """
+        Execute several independent MCP tool calls with their round trips overlapped.
+
+        Calls are grouped by server. Each server's group runs on its own thread,
+        and transports that support ``execute_many`` (HTTP stream, SSE) keep the
+        group's requests in flight together. Stdio servers share one pipe, so
+        their calls still run one after another. A group whose ``execute_many``
+        raised is retried one by one through ``execute_tool``. So are calls the
+        server turned away as conflicting, rate limited or overloaded (409, 429,
+        503), after waiting out any Retry-After.
+
+        Args:
+            calls: ``(server_name, tool_name, arguments)`` triples.
+
+        Returns:
+            One result dictionary per call, in call order, shaped like ``execute_tool``.
+        """
+        results: list[dict[str, Any] | None] = [None] * len(calls)
+        by_server: dict[str, list[int]] = {}
+
+        for index, (server_name, tool_name, _) in enumerate(calls):
+            # Resolve transports up front so worker threads never start servers
+            try:
+                if not self.config.is_server_enabled(server_name):
+                    results[index] = self._tool_error(
+                        server_name, tool_name, f"MCP server '{server_name}' is not enabled"
+                    )
+                    continue
+                self._get_transport(server_name)
+            except Exception as e:
+                results[index] = self._tool_error(server_name, tool_name, f"Error executing tool: {str(e)}")
+                continue
+
+            if tool_name not in self.tool_cache.get(server_name, []):
+                results[index] = self._tool_error(
+                    server_name, tool_name, f"Tool '{tool_name}' not found on server '{server_name}'"
+                )
+                continue
+
+            by_server.setdefault(server_name, []).append(index)
+
+        def _run_server(server_name: str, indices: list[int]) -> None:
+            transport = self.transports[server_name]
+            execute_many = getattr(transport, "execute_many", None)
+
+            def _run_one_by_one(pending: list[int]) -> None:
+                for index in pending:
+                    _, tool_name, arguments = calls[index]
+                    results[index] = self.execute_tool(server_name, tool_name, **arguments)
+
+            if execute_many is None or len(indices) == 1:
+                _run_one_by_one(indices)
+                return
+
+            try:
+                outputs = execute_many([(calls[index][1], calls[index][2]) for index in indices])
+            except Exception as e:
+                self._log.warning(f"Concurrent calls to '{server_name}' failed, running them one by one: {e}")
+                _run_one_by_one(indices)
+                return
+
+            rejected = []
+            delay = 0.0
+            for index, output in zip(indices, outputs, strict=True):
+                if _is_rejected_request(output):
+                    rejected.append(index)
+                    delay = max(delay, output.get("retry_after", _RESEND_DELAY_SECONDS))
+                else:
+                    results[index] = self._tool_success(server_name, calls[index][1], output)
+            if rejected:
+                time.sleep(min(delay, _MAX_RESEND_DELAY_SECONDS))
+                _run_one_by_one(rejected)
+
+        if len(by_server) == 1:
+            _run_server(*next(iter(by_server.items())))
+        elif by_server:
+            with ThreadPoolExecutor(max_workers=len(by_server)) as pool:
+                for future in [pool.submit(_run_server, name, indices) for name, indices in by_server.items()]:
+                    future.result()
+
+        return results
+
+    def _tool_success(self, server_name: str, tool_name: str, result: Any) -> dict[str, Any]:
+        """Build the result dictionary for a completed tool call, truncating oversized results."""
+        response = {
+            "success": True,
+            "result": result,
+            "error": None,
+            "tool": f"{server_name}:{tool_name}",
+            "tool_call": f"{server_name}:{tool_name}",
+        }
+
+        if self.max_result_chars is None:
+            return response
+
+        truncated_result, truncated = _truncate_strings(result, self.max_result_chars)
+        if truncated:
+            response["result"] = truncated_result
+            response["truncated"] = True
+        return response
+
+    def _tool_error(self, server_name: str, tool_name: str, error: str) -> dict[str, Any]:
+        """Build the result dictionary for a failed tool call."""
+        return {
+            "success": False,
+            "error": error,
+            "result": None,
+            "tool": f"{server_name}:{tool_name}",
+            "tool_call": f"{server_name}:{tool_name}",
+        }
 
     def get_available_tools(self) -> dict[str, list]:
         """
@@ -191,6 +316,40 @@ class MCPExecutor:
         self.tool_schema_cache = {}
 
 
+def _truncate_strings(value: Any, limit: int) -> tuple[Any, bool]:
+    """Cut every string in a tool result to at most limit characters.
+
+    Dicts and lists are rebuilt around the cut strings, so the result keeps its
+    type and structure. Returns the result and whether anything was cut.
+    """
+    if isinstance(value, str):
+        return (value[:limit], True) if len(value) > limit else (value, False)
+    if isinstance(value, dict):
+        items = {key: _truncate_strings(item, limit) for key, item in value.items()}
+        if any(cut for _, cut in items.values()):
+            return {key: item for key, (item, _) in items.items()}, True
+        return value, False
+    if isinstance(value, list):
+        items = [_truncate_strings(item, limit) for item in value]
+        if any(cut for _, cut in items):
+            return [item for item, _ in items], True
+        return value, False
+    return value, False
+
+
+def _is_rejected_request(output: Any) -> bool:
+    """Check whether a transport output is a 409, 429 or 503 the server answered without running the tool.
+
+    Only such rejections are safe to send again. Other 4xx errors are
+    deterministic argument or lookup failures, and a timeout or other 5xx
+    may come after the tool already ran. Tool calls are not idempotent.
+    """
+    if not isinstance(output, dict) or output.get("success", True):
+        return False
+    error = output.get("error")
+    return isinstance(error, str) and error.startswith(_RESEND_ERROR_PREFIXES)
+
+
 # Global MCP executor instance
 _mcp_executor: MCPExecutor | None = None
 
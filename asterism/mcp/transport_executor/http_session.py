@@ -0,0 +1,94 @@
+import atexit
+import threading
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Only failures where the server cannot have run the request are retried:
+# connection errors, where nothing was sent, and 503 on idempotent GETs,
+# honouring Retry-After. JSON-RPC tools/call POSTs are not idempotent, so a
+# read timeout or gateway error must never re-send one. The final response
+# is returned rather than raised so callers keep reporting the HTTP status.
+_RETRY = Retry(
+    total=3,
+    connect=3,
+    read=0,
+    backoff_factor=0.2,
+    status_forcelist=(503,),
+    allowed_methods=frozenset({"GET"}),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+_POOL_SIZE = 20
+
+# One pooled session shared by every HTTP transport instance, created on first use
+_shared_session: requests.Session | None = None
+_shared_session_lock = threading.Lock()
+
+# Error bodies are only surfaced as short messages, so never read more than this
+_ERROR_BODY_LIMIT = 4096
+
+
+def create_http_session() -> requests.Session:
+    """Create a requests session whose adapters retry transient failures."""
+    session = requests.Session()
+    adapter = HTTPAdapter(max_retries=_RETRY, pool_connections=_POOL_SIZE, pool_maxsize=_POOL_SIZE)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def shared_http_session() -> requests.Session:
+    """Return the process-wide HTTP session, creating it on first use.
+
+    Transports share it so TCP/TLS connections are pooled across transport
+    instances, not just across requests on one instance. Per-connection state
+    such as the MCP session ID must therefore travel in request headers, never
+    on the session itself. The session is closed at interpreter exit.
+    """
+    global _shared_session
+    if _shared_session is None:
+        with _shared_session_lock:
+            if _shared_session is None:
+                session = create_http_session()
+                atexit.register(session.close)
+                _shared_session = session
+    return _shared_session
+
+
+def read_error_body(response: requests.Response) -> str:
+    """Read at most the first few KiB of a streamed error response and release it.
+
+    Avoids pulling a large error page into memory and running charset
+    detection over it just to build a one-line error message.
+    """
+    try:
+        body = response.raw.read(_ERROR_BODY_LIMIT, decode_content=True)
+    finally:
+        response.close()
+    return body.decode("utf-8", "replace")
+
+
+def retry_after_seconds(response: requests.Response) -> float | None:
+    """Read a response's Retry-After header as seconds to wait, or None when absent or invalid.
+
+    The header holds either a number of seconds or an HTTP date.
+    """
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    return max(0.0, (when - datetime.now(UTC)).total_seconds())
@@ -1,9 +1,31 @@
-import json
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+import orjson
 import requests
 
 from .base import BaseTransport
+from .http_session import read_error_body, retry_after_seconds, shared_http_session
+
+# Headers sent with every request; the shared session carries no MCP-specific defaults
+_REQUEST_HEADERS = {
+    "Accept": "application/json, text/event-stream",
+    "Content-Type": "application/json",
+}
+
+# JSON object payloads of an SSE body: "data:" lines and bare JSON lines alike.
+# Event, id, retry and comment lines never start with "{" so the scan skips them.
+_SSE_JSON_PAYLOAD = re.compile(rb"^(?:data: ?)?(\{.*?)\r?$", re.MULTILINE)
+
+# Upper bound on parallel POSTs from one send_many call; stays well inside the
+# shared session's connection pool
+_MAX_CONCURRENT_REQUESTS = 8
+
+# The initialized notification never changes, so it is serialized once at import
+# and posted as raw bytes; requests sets Content-Length from the buffer directly.
+_INITIALIZED_BODY = orjson.dumps({"jsonrpc": "2.0", "method": "notifications/initialized"})
 
 
 class HTTPStreamTransport(BaseTransport):
@@ -12,10 +34,13 @@ class HTTPStreamTransport(BaseTransport):
     def __init__(self):
         self._session: requests.Session | None = None
         self._base_url: str | None = None
+        self._mcp_url: str | None = None
         self._timeout: int = 30
         self._request_id: int = 0
+        self._id_lock = threading.Lock()
         self._initialized: bool = False
         self._session_id: str | None = None
+        self._message_headers: dict[str, str] = {**_REQUEST_HEADERS, "mcp-session-id": ""}
 
     def start(self, command: str, args: list[str]) -> None:
         """Initialize HTTP session with base URL."""
@@ -23,38 +48,36 @@ class HTTPStreamTransport(BaseTransport):
             raise ValueError("HTTP transport requires server URL in args")
 
         self._base_url = args[0].rstrip("/")
-        self._session = requests.Session()
+        self._mcp_url = f"{self._base_url}/mcp"
+        self._session = shared_http_session()
 
         # Perform MCP initialization handshake
         self._initialize()
 
     def _initialize(self) -> None:
         """Perform MCP initialization handshake over HTTP Stream."""
-        url = f"{self._base_url}/mcp"
-        headers = self._build_request_headers()
-
         # Send initialize request
-        self._request_id += 1
-        init_request = self._build_init_request()
+        init_request = self._build_init_request(self._next_request_id())
 
         try:
-            response = self._session.post(
-                url,
-                json=init_request,
-                headers=headers,
+            # The with block releases the connection on the failure paths too
+            with self._session.post(
+                self._mcp_url,
+                data=orjson.dumps(init_request),
+                headers=_REQUEST_HEADERS,
                 stream=True,
                 timeout=self._timeout,
-            )
-            if not response.ok:
-                raise RuntimeError(f"HTTP initialization failed: {response.status_code}")
+            ) as response:
+                if not response.ok:
+                    raise RuntimeError(f"HTTP initialization failed: {response.status_code}")
 
-            # Extract session ID from response headers
-            self._session_id = self._extract_session_id(response)
-            if not self._session_id:
-                raise RuntimeError("No session ID received from server")
+                # Extract session ID from response headers
+                self._session_id = self._extract_session_id(response)
+                if not self._session_id:
+                    raise RuntimeError("No session ID received from server")
+                self._message_headers["mcp-session-id"] = self._session_id
 
-            # Parse the SSE-formatted response
-            result = self._parse_stream_response(response)
+                result = self._parse_response(response)
 
         except requests.RequestException as e:
             raise RuntimeError(f"HTTP connection failed: {str(e)}") from e
@@ -67,7 +90,13 @@ class HTTPStreamTransport(BaseTransport):
         # Send initialized notification
         self._send_initialized_notification()
 
-    def _build_init_request(self) -> dict[str, Any]:
+    def _next_request_id(self) -> int:
+        """Draw the next JSON-RPC request ID; safe to call from concurrent requests."""
+        with self._id_lock:
+            self._request_id += 1
+            return self._request_id
+
+    def _build_init_request(self, request_id: int) -> dict[str, Any]:
         """Build the MCP initialize request payload."""
         return {
             "jsonrpc": "2.0",
@@ -77,14 +106,7 @@ class HTTPStreamTransport(BaseTransport):
                 "capabilities": {},
                 "clientInfo": {"name": "ai-agent", "version": "0.1.0"},
             },
-            "id": self._request_id,
-        }
-
-    def _build_request_headers(self) -> dict[str, str]:
-        """Build HTTP request headers for MCP communication."""
-        return {
-            "Accept": "application/json, text/event-stream",
-            "Content-Type": "application/json",
+            "id": request_id,
         }
 
     def _extract_session_id(self, response: requests.Response) -> str | None:
@@ -92,77 +114,128 @@ class HTTPStreamTransport(BaseTransport):
         return response.headers.get("mcp-session-id")
 
     def _send_initialized_notification(self) -> None:
-        """Send the initialized notification to the server."""
-        notification = {
-            "jsonrpc": "2.0",
-            "method": "notifications/initialized",
-        }
-        self._send_message(notification)
+        """Send the initialized notification to the server.
+
+        Notifications get no JSON-RPC reply; the server answers with an empty
+        202, which is read in full so the connection returns to the pool.
+        """
+        try:
+            self._session.post(
+                self._mcp_url,
+                data=_INITIALIZED_BODY,
+                headers=self._message_headers,
+                timeout=self._timeout,
+            )
+        except requests.RequestException:
+            pass  # Notifications don't wait for response
+
+    def _parse_response(self, response: requests.Response) -> dict[str, Any]:
+        """Parse a JSON-RPC response, engaging the SSE parser only for event streams."""
+        content_type = response.headers.get("Content-Type", "")
+        if "application/json" in content_type:
+            return self._parse_json_response(response)
+        return self._parse_stream_response(response)
+
+    def _parse_json_response(self, response: requests.Response) -> dict[str, Any]:
+        """Parse a plain JSON response body with a single read."""
+        body = response.content
+        if not body:
+            return {}
+        try:
+            data = orjson.loads(body)
+        except orjson.JSONDecodeError:
+            return {}
+        return data if isinstance(data, dict) else {}
 
     def _parse_stream_response(self, response: requests.Response) -> dict[str, Any]:
-        """Parse SSE-formatted streaming response."""
+        """Parse SSE-formatted streaming response.
+
+        The body is read once and its JSON payloads are located with a
+        precompiled regex, so line splitting and prefix checks run in C.
+        """
         result = {}
-        for chunk in response.iter_lines():
-            if chunk:
-                try:
-                    line = chunk.decode("utf-8")
-                    # Handle SSE format
-                    if line.startswith("event: "):
-                        # Event type line, skip
-                        continue
-                    elif line.startswith("data: "):
-                        line = line[6:]  # Remove "data: " prefix
-                    # Try to parse JSON
-                    data = json.loads(line)
-                    if isinstance(data, dict):
-                        result = data
-                except (json.JSONDecodeError, UnicodeDecodeError):
-                    continue
+        loads = orjson.loads
+        for payload in _SSE_JSON_PAYLOAD.findall(response.content):
+            try:
+                data = loads(payload)
+            except orjson.JSONDecodeError:
+                continue
+            if isinstance(data, dict):
+                result = data
         return result
 
     def _send_message(self, message: dict[str, Any]) -> dict[str, Any]:
         """Send a JSON-RPC message via HTTP POST with streaming."""
-        if not self._session or not self._base_url:
+        if not self._session or not self._mcp_url:
             raise RuntimeError("HTTP transport not connected")
 
-        url = f"{self._base_url}/mcp"
-        headers = self._build_message_headers()
-
-        return self._post_request(url, headers, message)
-
-    def _build_message_headers(self) -> dict[str, str]:
-        """Build HTTP headers for sending messages with session ID."""
-        return {
-            "Accept": "application/json, text/event-stream",
-            "Content-Type": "application/json",
-            "mcp-session-id": self._session_id or "",
-        }
+        return self._post_request(self._mcp_url, self._message_headers, message)
 
     def _post_request(self, url: str, headers: dict[str, str], message: dict[str, Any]) -> dict[str, Any]:
         """Execute HTTP POST request and parse response."""
         try:
             with self._session.post(
                 url,
-                json=message,
+                data=orjson.dumps(message),
                 headers=headers,
                 stream=True,
                 timeout=self._timeout,
             ) as response:
                 if not response.ok:
-                    return {"error": f"HTTP error {response.status_code}: {response.text}"}
+                    # Retry-After tells the executor how long to wait before resending a rejected call
+                    retry_after = retry_after_seconds(response)
+                    error = {"error": f"HTTP error {response.status_code}: {read_error_body(response)}"}
+                    if retry_after is not None:
+                        error["retry_after"] = retry_after
+                    return error
 
-                return self._parse_stream_response(response)
+                return self._parse_response(response)
 
         except requests.RequestException as e:
             return {"error": f"Request failed: {str(e)}"}
 
+    def send_many(self, messages: list[dict[str, Any]]) -> dict[int, dict[str, Any]]:
+        """Send several JSON-RPC requests concurrently, one POST each.
+
+        Protocol version 2024-11-05 has no JSON-RPC batching, and servers reject
+        array bodies, so every request is its own POST. They run in parallel
+        over the shared session's connection pool, so the set costs about one
+        round trip instead of one per request.
+
+        Args:
+            messages: JSON-RPC requests without ``jsonrpc``/``id``, e.g.
+                ``{"method": "tools/call", "params": {...}}``.
+
+        Returns:
+            Mapping of assigned request ID to its response, in request order.
+        """
+        if not self._session or not self._mcp_url:
+            raise RuntimeError("HTTP transport not connected")
+
+        # IDs are assigned up front so worker threads never touch the counter
+        outgoing = [{**message, "jsonrpc": "2.0", "id": self._next_request_id()} for message in messages]
+
+        if not outgoing:
+            return {}
+
+        def post(request: dict[str, Any]) -> dict[str, Any]:
+            return self._post_request(self._mcp_url, self._message_headers, request)
+
+        if len(outgoing) == 1:
+            responses = [post(outgoing[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(len(outgoing), _MAX_CONCURRENT_REQUESTS)) as pool:
+                responses = list(pool.map(post, outgoing))
+
+        return {request["id"]: response for request, response in zip(outgoing, responses, strict=True)}
+
     def stop(self) -> None:
-        """Close HTTP session."""
-        if self._session:
-            self._session.close()
-            self._session = None
+        """Release the HTTP session; the shared connection pool stays open for other transports."""
+        self._session = None
         self._base_url = None
+        self._mcp_url = None
         self._session_id = None
+        self._message_headers["mcp-session-id"] = ""
         self._initialized = False
 
     def execute_tool(self, tool_name: str, **kwargs: Any) -> dict[str, Any]:
@@ -173,8 +246,7 @@ class HTTPStreamTransport(BaseTransport):
         if not self._initialized:
             raise RuntimeError("MCP server not initialized")
 
-        self._request_id += 1
-        request = self._build_tool_request(tool_name, kwargs)
+        request = self._build_tool_request(tool_name, kwargs, self._next_request_id())
 
         response = self._send_message(request)
 
@@ -183,13 +255,43 @@ class HTTPStreamTransport(BaseTransport):
 
         return self._parse_tool_result(response)
 
-    def _build_tool_request(self, tool_name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+    def execute_many(self, calls: list[tuple[str, dict[str, Any]]]) -> list[dict[str, Any]]:
+        """Execute several tools concurrently, one request per call.
+
+        Args:
+            calls: ``(tool_name, arguments)`` pairs.
+
+        Returns:
+            One result dictionary per call, in call order, shaped like ``execute_tool``.
+        """
+        if not self.is_alive():
+            raise RuntimeError("HTTP transport is not connected")
+
+        if not self._initialized:
+            raise RuntimeError("MCP server not initialized")
+
+        responses = self.send_many(
+            [
+                {"method": "tools/call", "params": {"name": name, "arguments": arguments or {}}}
+                for name, arguments in calls
+            ]
+        )
+
+        results = []
+        for response in responses.values():
+            if "error" in response:
+                results.append(_failed_call(response))
+            else:
+                results.append(self._parse_tool_result(response))
+        return results
+
+    def _build_tool_request(self, tool_name: str, arguments: dict[str, Any], request_id: int) -> dict[str, Any]:
         """Build the JSON-RPC request for tool execution."""
         return {
             "jsonrpc": "2.0",
             "method": "tools/call",
             "params": {"name": tool_name, "arguments": arguments or {}},
-            "id": self._request_id,
+            "id": request_id,
         }
 
     def _parse_tool_result(self, response: dict[str, Any]) -> dict[str, Any]:
@@ -200,31 +302,30 @@ class HTTPStreamTransport(BaseTransport):
         if not contents:
             return {"success": True, "result": {}}
 
-        # Aggregate text from all content blocks
-        text = self._extract_text_content(contents)
+        # A single text block is the common reply shape; read it directly
+        if len(contents) == 1 and contents[0].get("type") == "text":
+            text = contents[0].get("text", "")
+        else:
+            # Aggregate text from all content blocks
+            text = self._extract_text_content(contents)
 
         try:
-            parsed_result = json.loads(text) if text else {}
-        except json.JSONDecodeError:
+            parsed_result = orjson.loads(text) if text else {}
+        except orjson.JSONDecodeError:
             parsed_result = {"text": text}
 
         return {"success": True, "result": parsed_result}
 
     def _extract_text_content(self, contents: list[dict[str, Any]]) -> str:
         """Extract and aggregate text from content blocks."""
-        text = ""
-        for item in contents:
-            if item.get("type") == "text":
-                text += item.get("text", "")
-        return text
+        return "".join(item.get("text", "") for item in contents if item.get("type") == "text")
 
     def list_tools(self) -> list[str]:
         """List available tools via MCP protocol."""
         if not self.is_alive() or not self._initialized:
             return []
 
-        self._request_id += 1
-        request = self._build_list_tools_request()
+        request = self._build_list_tools_request(self._next_request_id())
 
         response = self._send_message(request)
 
@@ -233,12 +334,12 @@ class HTTPStreamTransport(BaseTransport):
 
         return self._parse_tools_response(response)
 
-    def _build_list_tools_request(self) -> dict[str, Any]:
+    def _build_list_tools_request(self, request_id: int) -> dict[str, Any]:
         """Build the JSON-RPC request for listing tools."""
         return {
             "jsonrpc": "2.0",
             "method": "tools/list",
-            "id": self._request_id,
+            "id": request_id,
         }
 
     def _parse_tools_response(self, response: dict[str, Any]) -> list[str]:
@@ -256,8 +357,7 @@ class HTTPStreamTransport(BaseTransport):
         if not self.is_alive() or not self._initialized:
             return []
 
-        self._request_id += 1
-        request = self._build_list_tools_request()
+        request = self._build_list_tools_request(self._next_request_id())
 
         response = self._send_message(request)
 
@@ -270,3 +370,11 @@ class HTTPStreamTransport(BaseTransport):
     def is_alive(self) -> bool:
         """Check if HTTP session is active."""
         return self._session is not None and self._base_url is not None
+
+
+def _failed_call(response: dict[str, Any]) -> dict[str, Any]:
+    """Build an execute_many result for a failed request, keeping any Retry-After delay."""
+    result = {"success": False, "error": response["error"]}
+    if "retry_after" in response:
+        result["retry_after"] = response["retry_after"]
+    return result
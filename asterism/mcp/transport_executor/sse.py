@@ -1,11 +1,31 @@
-import json
-import queue
+import itertools
+import logging
 import threading
+from concurrent.futures import Future, wait
 from typing import Any
 
+import orjson
 import requests
 
 from .base import BaseTransport
+from .http_session import read_error_body, retry_after_seconds, shared_http_session
+
+logger = logging.getLogger(__name__)
+
+# Upper bound for a single read from the event stream; read1 returns sooner
+# with whatever bytes have already arrived, so live events are not delayed.
+_READ_CHUNK_SIZE = 65536
+
+# Byte values the event stream scanner compares against
+_CR = ord("\r")
+_D = ord("d")
+_SPACE = ord(" ")
+
+# Upper bound on requests awaiting a response; the oldest is failed beyond this
+_MAX_PENDING_REQUESTS = 4096
+
+# Request bodies are serialized with orjson and posted as raw bytes
+_JSON_HEADERS = {"Content-Type": "application/json"}
 
 
 class SSETransport(BaseTransport):
@@ -14,13 +34,19 @@ class SSETransport(BaseTransport):
     def __init__(self):
         self._session: requests.Session | None = None
         self._base_url: str | None = None
+        self._sse_url: str | None = None
         self._timeout: int = 30
-        self._request_id: int = 0
+        # count.__next__ runs in C, so concurrent callers can never draw the same ID
+        self._next_request_id = itertools.count(1).__next__
         self._initialized: bool = False
         self._message_endpoint: str | None = None
-        self._response_queue: queue.Queue[dict[str, Any]] = queue.Queue()
+        self._pending: dict[Any, Future[dict[str, Any]]] = {}
+        # Guards the in-flight check, eviction and insert when requests are registered concurrently
+        self._pending_lock = threading.Lock()
         self._sse_thread: threading.Thread | None = None
+        self._sse_response: requests.Response | None = None
         self._stop_event = threading.Event()
+        self._endpoint_ready = threading.Event()
 
     def start(self, command: str, args: list[str]) -> None:
         """Initialize SSE connection to server."""
@@ -28,7 +54,8 @@ class SSETransport(BaseTransport):
             raise ValueError("SSE transport requires server URL in args")
 
         self._base_url = args[0].rstrip("/")
-        self._session = requests.Session()
+        self._sse_url = f"{self._base_url}/sse"
+        self._session = shared_http_session()
 
         # Perform MCP initialization handshake
         self._initialize()
@@ -36,56 +63,30 @@ class SSETransport(BaseTransport):
     def _initialize(self) -> None:
         """Perform MCP initialization handshake over SSE."""
         # First, connect to SSE endpoint to get the message endpoint
-        sse_url = f"{self._base_url}/sse"
-        try:
-            # Start SSE listener thread first
-            self._stop_event.clear()
-            self._sse_thread = threading.Thread(target=self._listen_sse, args=(sse_url,))
-            self._sse_thread.daemon = True
-            self._sse_thread.start()
-
-            # Wait a bit for the connection to establish and get the endpoint
-            import time
-
-            time.sleep(0.5)
+        self._stop_event.clear()
+        self._endpoint_ready.clear()
+        self._sse_thread = threading.Thread(target=self._listen_sse, args=(self._sse_url,))
+        self._sse_thread.daemon = True
+        self._sse_thread.start()
 
-            # The endpoint should have been extracted by the listener
-            if not self._message_endpoint:
-                self._extract_message_endpoint_fallback(sse_url)
-
-            if not self._message_endpoint:
-                raise RuntimeError("Failed to get message endpoint from SSE")
-
-        except requests.RequestException as e:
-            raise RuntimeError(f"SSE connection failed: {str(e)}") from e
+        # The listener signals as soon as the endpoint event arrives, or when it exits early
+        self._endpoint_ready.wait(timeout=self._timeout)
+        if not self._message_endpoint:
+            raise RuntimeError("Failed to get message endpoint from SSE")
 
         # Send initialize request
-        self._request_id += 1
-        init_request = self._build_init_request()
+        init_request = self._build_init_request(self._next_request_id())
 
         result = self._send_request(init_request)
         self._handle_init_response(result)
 
-    def _extract_message_endpoint_fallback(self, sse_url: str) -> None:
-        """Fallback method to extract message endpoint directly."""
-        response = self._session.get(sse_url, stream=True, timeout=self._timeout)
-        if response.ok:
-            for line in response.iter_lines():
-                if line:
-                    line_str = line.decode("utf-8")
-                    if line_str.startswith("data: "):
-                        endpoint = line_str[6:]
-                        self._message_endpoint = self._build_full_endpoint(endpoint)
-                        break
-            response.close()
-
     def _build_full_endpoint(self, endpoint: str) -> str:
         """Build full endpoint URL from relative or absolute path."""
         if endpoint.startswith("http"):
             return endpoint
         return f"{self._base_url}{endpoint}"
 
-    def _build_init_request(self) -> dict[str, Any]:
+    def _build_init_request(self, request_id: int) -> dict[str, Any]:
         """Build the MCP initialize request payload."""
         return {
             "jsonrpc": "2.0",
@@ -95,7 +96,7 @@ class SSETransport(BaseTransport):
                 "capabilities": {},
                 "clientInfo": {"name": "ai-agent", "version": "0.1.0"},
             },
-            "id": self._request_id,
+            "id": request_id,
         }
 
     def _handle_init_response(self, result: dict[str, Any]) -> None:
@@ -113,34 +114,67 @@ class SSETransport(BaseTransport):
         self._send_message(notification)
 
     def _listen_sse(self, sse_url: str) -> None:
-        """Listen for SSE events and put responses in queue."""
+        """Listen for SSE events and resolve the pending request each response belongs to.
+
+        Stream bytes accumulate in one reusable buffer that is scanned for
+        complete lines in place, so only "data:" payloads are ever copied out.
+        """
         try:
+            stopped = self._stop_event.is_set
+            process = self._process_sse_data
+            buffer = bytearray()
             with self._session.get(sse_url, stream=True, timeout=self._timeout) as response:
-                for line in response.iter_lines():
-                    if self._stop_event.is_set():
+                self._sse_response = response
+                read = response.raw.read1
+                while not stopped():
+                    # Reading the raw stream bypasses requests, so urllib3 must undo any Content-Encoding
+                    chunk = read(_READ_CHUNK_SIZE, decode_content=True)
+                    if not chunk:
                         break
-                    if line:
-                        try:
-                            line_str = line.decode("utf-8")
-                            if line_str.startswith("data: "):
-                                data_str = line_str[6:]
-                                self._process_sse_data(data_str)
-                        except (json.JSONDecodeError, UnicodeDecodeError):
-                            continue
+                    buffer += chunk
+                    start = 0
+                    while (end := buffer.find(b"\n", start)) != -1:
+                        line_end = end - 1 if end > start and buffer[end - 1] == _CR else end
+                        # Dispatch on the first byte: only "d" can open a "data:" field, so
+                        # event/id/retry/comment and blank lines are skipped by one compare
+                        if line_end > start and buffer[start] == _D and buffer.startswith(b"data:", start, line_end):
+                            payload_start = start + 5
+                            if payload_start < line_end and buffer[payload_start] == _SPACE:
+                                payload_start += 1
+                            try:
+                                process(buffer[payload_start:line_end])
+                            except (orjson.JSONDecodeError, UnicodeDecodeError):
+                                pass
+                        start = end + 1
+                    # Keep only the trailing partial line for the next read
+                    del buffer[:start]
         except Exception:
             # Thread will exit on errors
             pass
+        finally:
+            # Never leave the handshake waiting on a listener that has gone away
+            self._endpoint_ready.set()
 
-    def _process_sse_data(self, data_str: str) -> None:
-        """Process a single SSE data payload."""
+    def _process_sse_data(self, data: bytes | bytearray) -> None:
+        """Process a single SSE data payload, decoding JSON straight from bytes."""
         # Check if this is the endpoint URL
-        if data_str.startswith("/"):
-            # This is the message endpoint
-            self._message_endpoint = f"{self._base_url}{data_str}"
+        if data.startswith((b"/", b"http")):
+            # This is the message endpoint; wake the handshake waiting for it
+            self._message_endpoint = self._build_full_endpoint(data.decode("utf-8"))
+            self._endpoint_ready.set()
         else:
-            # This is a JSON response
-            data = json.loads(data_str)
-            self._response_queue.put(data)
+            # This is a JSON response; hand it to the caller waiting on its ID
+            message = orjson.loads(data)
+            if not isinstance(message, dict):
+                # Valid JSON that is not a JSON-RPC message; dropped without stopping the listener
+                logger.debug(f"Dropped non-object SSE payload: {type(message).__name__}")
+                return
+            future = self._pending.pop(message.get("id"), None)
+            if future is not None:
+                future.set_result(message)
+            elif "id" in message:
+                # Late reply to a timed-out or evicted request, or an ID never sent
+                logger.debug(f"Dropped SSE response for unmatched request ID {message['id']!r}")
 
     def _send_message(self, message: dict[str, Any]) -> None:
         """Send a JSON-RPC message via HTTP POST (notification - no response expected)."""
@@ -150,7 +184,8 @@ class SSETransport(BaseTransport):
         try:
             self._session.post(
                 self._message_endpoint,
-                json=message,
+                data=orjson.dumps(message),
+                headers=_JSON_HEADERS,
                 timeout=self._timeout,
             )
         except requests.RequestException:
@@ -158,52 +193,98 @@ class SSETransport(BaseTransport):
 
     def _send_request(self, message: dict[str, Any]) -> dict[str, Any]:
         """Send a JSON-RPC request and wait for response."""
+        future = self._dispatch_request(message)
+        try:
+            # Wait for the listener to deliver the response with matching ID
+            return self._wait_for_response(future)
+        finally:
+            self._pending.pop(message.get("id"), None)
+
+    def _dispatch_request(self, message: dict[str, Any]) -> Future[dict[str, Any]]:
+        """POST a JSON-RPC request and return the future its response will resolve.
+
+        The waiter is registered before the POST so the listener thread can
+        resolve it however early the response arrives, and concurrent callers
+        each receive only their own response. Transport errors resolve the
+        future immediately. The caller removes the pending entry once done.
+        """
         if not self._session or not self._message_endpoint:
             raise RuntimeError("SSE transport not connected")
 
         request_id = message.get("id")
+        future: Future[dict[str, Any]] = Future()
+        with self._pending_lock:
+            if request_id in self._pending:
+                raise RuntimeError(f"Request ID {request_id} is already in flight")
+            if len(self._pending) >= _MAX_PENDING_REQUESTS:
+                self._evict_oldest_pending()
+            self._pending[request_id] = future
 
         try:
             # Send the request
             response = self._session.post(
                 self._message_endpoint,
-                json=message,
+                data=orjson.dumps(message),
+                headers=_JSON_HEADERS,
+                stream=True,
                 timeout=self._timeout,
             )
             if not response.ok:
-                return {"error": f"HTTP error {response.status_code}: {response.text}"}
-
-            # Wait for response with matching ID
-            return self._wait_for_response(request_id)
-
+                # Retry-After tells the executor how long to wait before resending a rejected call
+                retry_after = retry_after_seconds(response)
+                error = {"error": f"HTTP error {response.status_code}: {read_error_body(response)}"}
+                if retry_after is not None:
+                    error["retry_after"] = retry_after
+            else:
+                # The reply arrives on the event stream. Drain the short 202 body
+                # before releasing it, or urllib3 discards the keep-alive connection.
+                response.content
+                response.close()
+                return future
         except requests.RequestException as e:
-            return {"error": f"Request failed: {str(e)}"}
+            error = {"error": f"Request failed: {str(e)}"}
 
-    def _wait_for_response(self, request_id: Any) -> dict[str, Any]:
-        """Wait for a response with the matching request ID."""
-        timeout_count = 0
-        max_timeout = self._timeout * 10  # 0.1s * 300 = 30 seconds
-        while timeout_count < max_timeout:
-            try:
-                result = self._response_queue.get(timeout=0.1)
-                if result.get("id") == request_id:
-                    return result
-                # Not our response, put it back? No, just continue waiting
-            except queue.Empty:
-                timeout_count += 1
-                continue
+        # Only resolve here if the listener has not claimed the future already
+        if self._pending.pop(request_id, None) is not None:
+            future.set_result(error)
+        return future
 
-        return {"error": "Timeout waiting for response"}
+    def _evict_oldest_pending(self) -> None:
+        """Fail the longest-waiting request so the correlation map stays bounded."""
+        try:
+            oldest = next(iter(self._pending))
+        except StopIteration:
+            return
+        future = self._pending.pop(oldest, None)
+        if future is not None:
+            future.set_result({"error": "Request dropped: too many requests in flight"})
+
+    def _wait_for_response(self, future: Future[dict[str, Any]]) -> dict[str, Any]:
+        """Block until the listener resolves the request's future or the timeout expires."""
+        try:
+            return future.result(timeout=self._timeout)
+        except TimeoutError:
+            return {"error": "Timeout waiting for response"}
 
     def stop(self) -> None:
-        """Close SSE connection."""
+        """Close the SSE stream and release the shared HTTP session."""
         self._stop_event.set()
+        # Wake any caller still waiting on a response that will never arrive
+        while True:
+            try:
+                _, future = self._pending.popitem()
+            except KeyError:
+                break
+            future.set_result({"error": "SSE transport stopped"})
+        # Closing the stream unblocks the listener; the shared session stays open
+        if self._sse_response is not None:
+            self._sse_response.close()
+            self._sse_response = None
         if self._sse_thread and self._sse_thread.is_alive():
             self._sse_thread.join(timeout=2)
-        if self._session:
-            self._session.close()
-            self._session = None
+        self._session = None
         self._base_url = None
+        self._sse_url = None
         self._message_endpoint = None
         self._initialized = False
 
@@ -215,8 +296,7 @@ class SSETransport(BaseTransport):
         if not self._initialized:
             raise RuntimeError("MCP server not initialized")
 
-        self._request_id += 1
-        request = self._build_tool_request(tool_name, kwargs)
+        request = self._build_tool_request(tool_name, kwargs, self._next_request_id())
 
         response = self._send_request(request)
 
@@ -225,13 +305,51 @@ class SSETransport(BaseTransport):
 
         return self._parse_tool_result(response)
 
-    def _build_tool_request(self, tool_name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+    def execute_many(self, calls: list[tuple[str, dict[str, Any]]]) -> list[dict[str, Any]]:
+        """Execute several tools with their requests in flight together.
+
+        All requests are posted before any response is awaited, and the
+        listener resolves them by ID as they arrive, so N independent calls
+        cost roughly one round trip instead of N.
+
+        Args:
+            calls: ``(tool_name, arguments)`` pairs.
+
+        Returns:
+            One result dictionary per call, in call order, shaped like ``execute_tool``.
+        """
+        if not self.is_alive():
+            raise RuntimeError("SSE transport is not connected")
+
+        if not self._initialized:
+            raise RuntimeError("MCP server not initialized")
+
+        messages = [self._build_tool_request(name, arguments, self._next_request_id()) for name, arguments in calls]
+        futures = []
+        try:
+            for message in messages:
+                futures.append(self._dispatch_request(message))
+            done, _ = wait(futures, timeout=self._timeout)
+        finally:
+            for message in messages:
+                self._pending.pop(message["id"], None)
+
+        results = []
+        for future in futures:
+            response = future.result() if future in done else {"error": "Timeout waiting for response"}
+            if "error" in response:
+                results.append(_failed_call(response))
+            else:
+                results.append(self._parse_tool_result(response))
+        return results
+
+    def _build_tool_request(self, tool_name: str, arguments: dict[str, Any], request_id: int) -> dict[str, Any]:
         """Build the JSON-RPC request for tool execution."""
         return {
             "jsonrpc": "2.0",
             "method": "tools/call",
             "params": {"name": tool_name, "arguments": arguments or {}},
-            "id": self._request_id,
+            "id": request_id,
         }
 
     def _parse_tool_result(self, response: dict[str, Any]) -> dict[str, Any]:
@@ -242,31 +360,30 @@ class SSETransport(BaseTransport):
         if not contents:
             return {"success": True, "result": {}}
 
-        # Aggregate text from all content blocks
-        text = self._extract_text_content(contents)
+        # A single text block is the common reply shape; read it directly
+        if len(contents) == 1 and contents[0].get("type") == "text":
+            text = contents[0].get("text", "")
+        else:
+            # Aggregate text from all content blocks
+            text = self._extract_text_content(contents)
 
         try:
-            parsed_result = json.loads(text) if text else {}
-        except json.JSONDecodeError:
+            parsed_result = orjson.loads(text) if text else {}
+        except orjson.JSONDecodeError:
             parsed_result = {"text": text}
 
         return {"success": True, "result": parsed_result}
 
     def _extract_text_content(self, contents: list[dict[str, Any]]) -> str:
         """Extract and aggregate text from content blocks."""
-        text = ""
-        for item in contents:
-            if item.get("type") == "text":
-                text += item.get("text", "")
-        return text
+        return "".join(item.get("text", "") for item in contents if item.get("type") == "text")
 
     def list_tools(self) -> list[str]:
         """List available tools via MCP protocol."""
         if not self.is_alive() or not self._initialized:
             return []
 
-        self._request_id += 1
-        request = self._build_list_tools_request()
+        request = self._build_list_tools_request(self._next_request_id())
 
         response = self._send_request(request)
 
@@ -275,12 +392,12 @@ class SSETransport(BaseTransport):
 
         return self._parse_tools_response(response)
 
-    def _build_list_tools_request(self) -> dict[str, Any]:
+    def _build_list_tools_request(self, request_id: int) -> dict[str, Any]:
         """Build the JSON-RPC request for listing tools."""
         return {
             "jsonrpc": "2.0",
             "method": "tools/list",
-            "id": self._request_id,
+            "id": request_id,
         }
 
     def _parse_tools_response(self, response: dict[str, Any]) -> list[str]:
@@ -298,8 +415,7 @@ class SSETransport(BaseTransport):
         if not self.is_alive() or not self._initialized:
             return []
 
-        self._request_id += 1
-        request = self._build_list_tools_request()
+        request = self._build_list_tools_request(self._next_request_id())
 
         response = self._send_request(request)
 
@@ -312,3 +428,11 @@ class SSETransport(BaseTransport):
     def is_alive(self) -> bool:
         """Check if SSE connection is active."""
         return self._session is not None and self._base_url is not None
+
+
+def _failed_call(response: dict[str, Any]) -> dict[str, Any]:
+    """Build an execute_many result for a failed request, keeping any Retry-After delay."""
+    result = {"success": False, "error": response["error"]}
+    if "retry_after" in response:
+        result["retry_after"] = response["retry_after"]
+    return result
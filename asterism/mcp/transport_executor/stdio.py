@@ -1,10 +1,16 @@
 import ast
-import json
 import subprocess
-from typing import Any
+import threading
+from typing import IO, Any
+
+import orjson
 
 from .base import BaseTransport
 
+# Pipes run in binary mode through a 64 KiB buffer so responses go from the
+# BufferedReader straight to orjson with no TextIOWrapper decode in between
+_PIPE_BUFFER_SIZE = 65536
+
 
 class StdioTransport(BaseTransport):
     """Transport for MCP servers using stdio communication."""
@@ -13,6 +19,9 @@ class StdioTransport(BaseTransport):
         self._process = None
         self._request_id = 0
         self._initialized = False
+        self._stderr_thread: threading.Thread | None = None
+        # stdin/stdout carry one exchange at a time; concurrent callers would read each other's responses
+        self._lock = threading.Lock()
 
     def start(self, command: str, args: list[str], cwd: str | None = None) -> None:
         """Start the MCP server process."""
@@ -22,16 +31,33 @@ class StdioTransport(BaseTransport):
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,
-                universal_newlines=True,
+                bufsize=_PIPE_BUFFER_SIZE,
                 cwd=cwd,
             )
+            # Keep stderr flowing so a chatty server never blocks mid-response
+            self._stderr_thread = threading.Thread(target=self._drain_stderr, args=(self._process.stderr,))
+            self._stderr_thread.daemon = True
+            self._stderr_thread.start()
+
             # Perform MCP initialization handshake
             self._initialize()
         except Exception as e:
             raise RuntimeError(f"Failed to start MCP server: {str(e)}") from e
 
+    def _drain_stderr(self, stderr: IO[bytes]) -> None:
+        """Discard the server's stderr output until the pipe closes.
+
+        Nothing reads stderr otherwise, so once its OS pipe buffer filled the
+        server would block on a log write and the caller would wait forever on
+        a stdout response that never comes.
+        """
+        try:
+            for _ in stderr:
+                pass
+        except (OSError, ValueError):
+            # Pipe closed while the process is being stopped
+            pass
+
     def _initialize(self) -> None:
         """Perform MCP initialization handshake."""
         self._request_id += 1
@@ -39,7 +65,7 @@ class StdioTransport(BaseTransport):
 
         self._send_json_request(request)
         response = self._read_json_response()
-        result = json.loads(response)
+        result = orjson.loads(response)
 
         if "error" in result:
             raise RuntimeError(f"MCP initialization failed: {result['error']}")
@@ -64,10 +90,10 @@ class StdioTransport(BaseTransport):
 
     def _send_json_request(self, request: dict[str, Any]) -> None:
         """Send a JSON-RPC request to the process stdin."""
-        self._process.stdin.write(json.dumps(request) + "\n")
+        self._process.stdin.write(orjson.dumps(request) + b"\n")
         self._process.stdin.flush()
 
-    def _read_json_response(self) -> str:
+    def _read_json_response(self) -> bytes:
         """Read a JSON-RPC response from the process stdout."""
         return self._process.stdout.readline()
 
@@ -94,17 +120,18 @@ class StdioTransport(BaseTransport):
         if not self.is_alive():
             raise RuntimeError("Server process is not running")
 
-        self._request_id += 1
-        request: dict[str, Any] = {"jsonrpc": "2.0", "method": method, "id": self._request_id}
-        if params is not None:
-            request["params"] = params
+        with self._lock:
+            self._request_id += 1
+            request: dict[str, Any] = {"jsonrpc": "2.0", "method": method, "id": self._request_id}
+            if params is not None:
+                request["params"] = params
 
-        try:
-            self._send_json_request(request)
-            response = self._read_json_response()
-            return json.loads(response)
-        except Exception as e:
-            raise RuntimeError(f"Request failed: {str(e)}") from e
+            try:
+                self._send_json_request(request)
+                response = self._read_json_response()
+                return orjson.loads(response)
+            except Exception as e:
+                raise RuntimeError(f"Request failed: {str(e)}") from e
 
     def execute_tool(self, tool_name: str, **kwargs: Any) -> str | dict[str, Any]:
         """Execute a tool via MCP protocol over stdio with robust parsing."""
@@ -126,33 +153,35 @@ class StdioTransport(BaseTransport):
         if not contents:
             return {}
 
-        # Aggregate text from all content blocks
-        text = self._extract_text_content(contents)
+        # A single text block is the common reply shape; read it directly
+        if len(contents) == 1 and contents[0].get("type") == "text":
+            text = contents[0].get("text", "")
+        else:
+            # Aggregate text from all content blocks
+            text = self._extract_text_content(contents)
 
         return self._parse_tool_output(text)
 
     def _extract_text_content(self, contents: list[dict[str, Any]]) -> str:
         """Extract and aggregate text from content blocks."""
-        text = ""
-        for item in contents:
-            if item.get("type") == "text":
-                text += item.get("text", "")
-        return text
+        return "".join(item.get("text", "") for item in contents if item.get("type") == "text")
 
     def _parse_tool_output(self, text: str) -> str | dict[str, Any]:
         """Parse tool output text into a dictionary."""
         try:
             # Try standard JSON first
-            data = json.loads(text)
-        except json.JSONDecodeError:
-            try:
-                # Fallback to Python literal parsing if the tool sent single quotes
-                data = ast.literal_eval(text)
-            except (ValueError, SyntaxError):
-                if isinstance(text, str):
-                    data = text
-                else:
-                    raise RuntimeError(f"Could not parse tool output: {text}")
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+
+        try:
+            # Fallback to Python literal parsing if the tool sent single quotes
+            data = ast.literal_eval(text)
+        except (ValueError, SyntaxError):
+            if isinstance(text, str):
+                data = text
+            else:
+                raise RuntimeError(f"Could not parse tool output: {text}")
 
         return data
 
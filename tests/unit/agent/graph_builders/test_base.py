@@ -0,0 +1,56 @@
+"""Test shared graph builder utilities."""
+
+from unittest.mock import MagicMock, patch
+
+from langchain_core.messages import HumanMessage
+
+from asterism.agent.graph_builders.base import changed_fields
+from asterism.agent.models import Plan, Task, TaskResult
+from asterism.agent.nodes.evaluator.service import _handle_continue_decision
+from asterism.agent.nodes.shared import advance_task
+
+
+def test_changed_fields_keeps_only_replaced_values():
+    """Test that untouched fields are dropped from the node update."""
+    state = {
+        "session_id": "test",
+        "messages": [HumanMessage(content="Hello")],
+        "current_task_index": 0,
+        "execution_results": [],
+        "error": None,
+        "llm_usage": [],
+    }
+
+    new_state = advance_task(state, TaskResult(task_id="task_1", success=True, result="ok"))
+    update = changed_fields(state, new_state)
+
+    assert set(update) == {"execution_results", "current_task_index"}
+    assert update["current_task_index"] == 1
+
+
+def test_changed_fields_includes_new_keys():
+    """Test that fields absent from the input state are kept."""
+    update = changed_fields({"error": None}, {"error": None, "evaluation_result": None})
+    assert update == {"evaluation_result": None}
+
+
+def test_changed_fields_reports_resolved_tool_inputs():
+    """Test that inputs resolved by the evaluator replace the plan, so the change is reported."""
+    plan = Plan(
+        tasks=[
+            Task(id="task_1", description="List"),
+            Task(id="task_2", description="Read", tool_call="fs:read", tool_input={"path": "?"}),
+        ],
+        reasoning="Read after listing",
+    )
+    state = {"plan": plan, "current_task_index": 1, "llm_usage": []}
+
+    with patch(
+        "asterism.agent.nodes.evaluator.service.resolve_next_task_inputs", return_value=({"path": "a.md"}, None)
+    ):
+        new_state = _handle_continue_decision(state.copy(), MagicMock())
+
+    update = changed_fields(state, new_state)
+
+    assert update["plan"].tasks[1].tool_input == {"path": "a.md"}
+    assert plan.tasks[1].tool_input == {"path": "?"}
@@ -5,6 +5,7 @@ from asterism.agent.nodes.evaluator.router import (
     RouteTarget,
     _determine_fallback_route,
     _route_from_decision,
+    can_skip_evaluation,
     determine_route,
     should_continue,
 )
@@ -311,3 +312,70 @@ def test_should_continue_with_evaluation():
 
     result = should_continue(state)
     assert result == "finalizer_node"
+
+
+def _completed_state(plan: Plan, results: list[TaskResult]) -> AgentState:
+    return {
+        "session_id": "test",
+        "trace_id": "trace_123",
+        "messages": [],
+        "plan": plan,
+        "current_task_index": len(plan.tasks),
+        "execution_results": results,
+        "evaluation_result": None,
+        "final_response": None,
+        "error": None,
+        "llm_usage": [],
+    }
+
+
+def test_can_skip_evaluation_for_completed_branching_plan():
+    """Test that a non-linear plan whose tasks all succeeded skips the LLM evaluator."""
+    plan = Plan(
+        tasks=[
+            Task(id="a", description="Read A"),
+            Task(id="b", description="Read B"),
+            Task(id="c", description="Combine", depends_on=["a", "b"]),
+        ],
+        reasoning="Fan-in",
+    )
+    results = [TaskResult(task_id=t.id, success=True, result="ok") for t in plan.tasks]
+
+    assert can_skip_evaluation(_completed_state(plan, results))
+
+
+def test_can_skip_evaluation_ignores_failures_from_replaced_plans():
+    """Test that failures of tasks no longer in the plan do not block the fast path."""
+    plan = Plan(tasks=[Task(id="retry", description="Retry")], reasoning="Replan")
+    results = [
+        TaskResult(task_id="first", success=False, error="boom"),
+        TaskResult(task_id="retry", success=True, result="ok"),
+    ]
+
+    assert can_skip_evaluation(_completed_state(plan, results))
+
+
+def test_can_skip_evaluation_requires_every_task_to_succeed():
+    """Test that a failed or missing task result keeps the LLM evaluation."""
+    plan = Plan(tasks=[Task(id="a", description="A"), Task(id="b", description="B")], reasoning="Test")
+
+    failed = [TaskResult(task_id="a", success=True), TaskResult(task_id="b", success=False, error="boom")]
+    missing = [TaskResult(task_id="a", success=True)]
+
+    assert not can_skip_evaluation(_completed_state(plan, failed))
+    assert not can_skip_evaluation(_completed_state(plan, missing))
+
+    incomplete = _completed_state(plan, failed[:1])
+    incomplete["current_task_index"] = 1
+    assert not can_skip_evaluation(incomplete)
+
+
+def test_can_skip_evaluation_ignores_trailing_failure_outside_plan():
+    """Test that the failed-tail shortcut only applies to tasks in the current plan."""
+    plan = Plan(tasks=[Task(id="retry", description="Retry")], reasoning="Replan")
+    results = [
+        TaskResult(task_id="retry", success=True, result="ok"),
+        TaskResult(task_id="stale", success=False, error="boom"),
+    ]
+
+    assert can_skip_evaluation(_completed_state(plan, results))
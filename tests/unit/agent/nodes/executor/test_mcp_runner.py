@@ -0,0 +1,45 @@
+"""Test MCP runner result handling."""
+
+from unittest.mock import MagicMock, patch
+
+from asterism.agent.models import Task
+from asterism.agent.nodes.executor.mcp_runner import MCPRunner
+
+
+def test_execute_carries_truncated_flag():
+    """Test that a truncated tool result is flagged on the task result."""
+    mcp_executor = MagicMock()
+    mcp_executor.execute_tool.return_value = {"success": True, "result": "x" * 10, "error": None, "truncated": True}
+
+    result = MCPRunner(mcp_executor).execute(Task(id="a", description="Read", tool_call="fs:read"), {})
+
+    assert result.result == "x" * 10
+    assert result.truncated is True
+
+
+def test_execute_batch_carries_truncated_flag():
+    """Test that batched task results keep each call's truncated flag."""
+    mcp_executor = MagicMock()
+    mcp_executor.execute_tools_batch.return_value = [
+        {"success": True, "result": "x" * 10, "error": None, "truncated": True},
+        {"success": True, "result": "small", "error": None},
+    ]
+    tasks = [
+        Task(id="a", description="Read A", tool_call="fs:read"),
+        Task(id="b", description="Read B", tool_call="fs:read"),
+    ]
+
+    results = MCPRunner(mcp_executor).execute_batch(tasks, {})
+
+    assert [r.truncated for r in results] == [True, False]
+
+
+def test_log_preview_is_bounded_for_structured_results():
+    """Test that the log preview of a large structured result stays short."""
+    mcp_executor = MagicMock()
+    mcp_executor.execute_tool.return_value = {"success": True, "result": {"rows": [str(i) * 1000 for i in range(1000)]}}
+
+    with patch("asterism.agent.nodes.executor.mcp_runner.log_mcp_tool_call") as log_call:
+        MCPRunner(mcp_executor).execute(Task(id="a", description="Read", tool_call="fs:read"), {})
+
+    assert len(log_call.call_args.kwargs["result_preview"]) <= 500
@@ -0,0 +1,138 @@
+"""Test executor node batching of independent tasks."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+from asterism.agent.models import Plan, Task, TaskResult
+from asterism.agent.nodes.executor.llm_runner import LLMRunner
+from asterism.agent.nodes.executor.node import _collect_ready_tasks, executor_node
+
+
+def _make_state(plan: Plan, **overrides) -> dict:
+    state = {
+        "session_id": "test",
+        "trace_id": "trace_123",
+        "messages": [],
+        "plan": plan,
+        "current_task_index": 0,
+        "execution_results": [],
+        "final_response": None,
+        "error": None,
+        "llm_usage": [],
+    }
+    state.update(overrides)
+    return state
+
+
+def _fan_in_plan() -> Plan:
+    """Two independent LLM tasks followed by a task that depends on both."""
+    return Plan(
+        tasks=[
+            Task(id="a", description="Summarize A"),
+            Task(id="b", description="Summarize B"),
+            Task(id="c", description="Combine", depends_on=["a", "b"]),
+        ],
+        reasoning="Fan-in",
+    )
+
+
+def test_collect_ready_tasks_stops_at_unsatisfied_dependency():
+    """Test that only tasks ready now are batched."""
+    ready = _collect_ready_tasks(_make_state(_fan_in_plan()))
+    assert [t.id for t in ready] == ["a", "b"]
+
+
+def test_collect_ready_tasks_stops_at_tool_task_needing_resolution():
+    """Test that later tool tasks depending on earlier results end the batch."""
+    plan = Plan(
+        tasks=[
+            Task(id="a", description="Read", tool_call="fs:read"),
+            Task(id="b", description="Think"),
+            Task(id="c", description="List", tool_call="fs:list"),
+            Task(id="d", description="Write", tool_call="fs:write", depends_on=["a"]),
+            Task(id="e", description="Think more"),
+        ],
+        reasoning="Mixed",
+    )
+    results = [TaskResult(task_id="a", success=True, result="x")]
+    state = _make_state(plan, current_task_index=1, execution_results=results)
+
+    assert [t.id for t in _collect_ready_tasks(state)] == ["b", "c"]
+
+
+def test_executor_runs_independent_llm_tasks_concurrently():
+    """Test that ready LLM tasks run in parallel and results keep plan order."""
+    barrier = threading.Barrier(2, timeout=5)
+
+    def _execute(self, task, state):
+        barrier.wait()
+        return TaskResult(task_id=task.id, success=True, result=task.description)
+
+    with patch.object(LLMRunner, "execute", _execute):
+        new_state = executor_node(MagicMock(), MagicMock(), _make_state(_fan_in_plan()))
+
+    assert [r.task_id for r in new_state["execution_results"]] == ["a", "b"]
+    assert new_state["current_task_index"] == 2
+    assert new_state["error"] is None
+
+
+def test_executor_batch_stops_at_first_failure():
+    """Test that a failed task ends the batch before later results are recorded."""
+
+    def _execute(self, task, state):
+        if task.id == "a":
+            return TaskResult(task_id=task.id, success=False, error="boom")
+        return TaskResult(task_id=task.id, success=True, result="ok")
+
+    with patch.object(LLMRunner, "execute", _execute):
+        new_state = executor_node(MagicMock(), MagicMock(), _make_state(_fan_in_plan()))
+
+    assert [r.task_id for r in new_state["execution_results"]] == ["a"]
+    assert new_state["current_task_index"] == 1
+    assert new_state["error"] == "boom"
+
+
+def test_executor_batches_tool_and_llm_tasks():
+    """Test that independent tool calls go out as one MCP batch next to LLM tasks."""
+    plan = Plan(
+        tasks=[
+            Task(id="a", description="Read A", tool_call="fs:read", tool_input={"path": "a"}),
+            Task(id="b", description="Think"),
+            Task(id="c", description="Read C", tool_call="fs:read", tool_input={"path": "c"}),
+        ],
+        reasoning="Fan-out",
+    )
+    mcp_executor = MagicMock()
+    mcp_executor.execute_tools_batch.return_value = [
+        {"success": True, "result": "A", "error": None},
+        {"success": False, "result": None, "error": "missing"},
+    ]
+
+    def _execute(self, task, state):
+        return TaskResult(task_id=task.id, success=True, result="thought")
+
+    with patch.object(LLMRunner, "execute", _execute):
+        new_state = executor_node(MagicMock(), mcp_executor, _make_state(plan))
+
+    mcp_executor.execute_tools_batch.assert_called_once_with(
+        [("fs", "read", {"path": "a"}), ("fs", "read", {"path": "c"})]
+    )
+    assert [(r.task_id, r.success) for r in new_state["execution_results"]] == [("a", True), ("b", True), ("c", False)]
+    assert new_state["current_task_index"] == 3
+    assert new_state["error"] == "missing"
+
+
+def test_executor_llm_only_batch_skips_outer_pool():
+    """Test that a batch without tool tasks runs the LLM batch directly, with no extra pool."""
+
+    def _execute(self, task, state):
+        return TaskResult(task_id=task.id, success=True, result=task.description)
+
+    with (
+        patch.object(LLMRunner, "execute", _execute),
+        patch("asterism.agent.nodes.executor.node.ThreadPoolExecutor") as pool_class,
+    ):
+        new_state = executor_node(MagicMock(), MagicMock(), _make_state(_fan_in_plan()))
+
+    pool_class.assert_not_called()
+    assert [r.task_id for r in new_state["execution_results"]] == ["a", "b"]
@@ -0,0 +1,18 @@
+"""Test executor utility functions."""
+
+import pytest
+
+from asterism.agent.nodes.executor.utils import parse_tool_call
+
+
+def test_parse_tool_call_splits_on_first_colon():
+    """Test parsing server and tool names."""
+    assert parse_tool_call("filesystem:read_file") == ("filesystem", "read_file")
+    assert parse_tool_call("server:tool:extra") == ("server", "tool:extra")
+
+
+def test_parse_tool_call_rejects_missing_separator():
+    """Test that invalid formats raise every time, not just on first call."""
+    for _ in range(2):
+        with pytest.raises(ValueError, match="Expected 'server:tool'"):
+            parse_tool_call("read_file")
@@ -0,0 +1,144 @@
+"""Test the planner plan cache."""
+
+from unittest.mock import MagicMock, patch
+
+from langchain_core.messages import HumanMessage
+
+from asterism.agent.models import Plan, Task, TaskResult
+from asterism.agent.nodes.planner import cache as plan_cache_module
+from asterism.agent.nodes.planner.cache import PlanCache
+from asterism.agent.nodes.planner.node import planner_node
+from asterism.agent.nodes.shared import LLMCallResult
+from asterism.config import PlannerConfig
+
+
+def _make_plan(description: str = "Read file") -> Plan:
+    return Plan(tasks=[Task(id="task_1", description=description)], reasoning="Simple plan")
+
+
+def _make_state(**overrides) -> dict:
+    state = {
+        "session_id": "test",
+        "trace_id": "trace_123",
+        "messages": [HumanMessage(content="Read the config")],
+        "plan": None,
+        "current_task_index": 0,
+        "execution_results": [],
+        "final_response": None,
+        "error": None,
+        "llm_usage": [],
+    }
+    state.update(overrides)
+    return state
+
+
+def test_make_key_normalizes_whitespace_only():
+    """Test that whitespace differences share a key while case differences do not."""
+    key = PlanCache.make_key("Read  /data/Report.md", "tools", "tree", "model", "prompt")
+    assert key == PlanCache.make_key(" Read /data/Report.md ", "tools", "tree", "model", "prompt")
+    assert key != PlanCache.make_key("read /data/report.md", "tools", "tree", "model", "prompt")
+
+
+def test_make_key_covers_all_planning_inputs():
+    """Test that changing tools, workspace, model or prompt changes the key."""
+    key = PlanCache.make_key("Read the config", "tools", "tree", "model", "prompt")
+    assert key != PlanCache.make_key("Read the config", "other tools", "tree", "model", "prompt")
+    assert key != PlanCache.make_key("Read the config", "tools", "other tree", "model", "prompt")
+    assert key != PlanCache.make_key("Read the config", "tools", "tree", "other model", "prompt")
+    assert key != PlanCache.make_key("Read the config", "tools", "tree", "model", "other prompt")
+
+
+def test_get_returns_copy():
+    """Test that cached plans are isolated from caller mutation."""
+    cache = PlanCache()
+    cache.put("key", _make_plan())
+
+    first = cache.get("key")
+    first.tasks[0].description = "Changed"
+
+    assert cache.get("key").tasks[0].description == "Read file"
+    assert cache.get("missing") is None
+
+
+def test_put_evicts_least_recently_used():
+    """Test LRU eviction once the cache is full."""
+    cache = PlanCache(max_size=2)
+    cache.put("a", _make_plan("a"))
+    cache.put("b", _make_plan("b"))
+    cache.get("a")
+    cache.put("c", _make_plan("c"))
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+
+
+def test_planner_config_disables_plan_cache_by_default():
+    """Test that plan caching is off unless config.yaml switches it on."""
+    assert PlannerConfig().plan_cache is False
+    assert PlannerConfig.model_validate({"plan_cache": True}).plan_cache is True
+
+
+@patch("asterism.agent.nodes.planner.context.get_workspace_tree_context", return_value="tree")
+@patch("asterism.agent.nodes.planner.node.LLMCaller")
+def test_planner_reuses_cached_plan(mock_caller_cls, _tree, monkeypatch):
+    """Test that a repeated request skips the LLM when caching is enabled."""
+    monkeypatch.setattr(plan_cache_module, "_plan_cache", PlanCache())
+
+    usage = MagicMock()
+    mock_caller_cls.return_value.call_structured.return_value = LLMCallResult(
+        parsed=_make_plan(), usage=usage, duration_ms=1.0
+    )
+    llm = MagicMock()
+    llm.model = "test-model"
+    mcp_executor = MagicMock()
+    mcp_executor.get_tool_schemas.return_value = {}
+
+    first = planner_node(llm, mcp_executor, _make_state(), plan_cache_enabled=True)
+    second = planner_node(llm, mcp_executor, _make_state(), plan_cache_enabled=True)
+
+    assert mock_caller_cls.return_value.call_structured.call_count == 1
+    assert second["plan"] == first["plan"]
+    assert second["llm_usage"][0].total_tokens == 0
+
+
+@patch("asterism.agent.nodes.planner.context.get_workspace_tree_context", return_value="tree")
+@patch("asterism.agent.nodes.planner.node.LLMCaller")
+def test_planner_skips_cache_when_replanning(mock_caller_cls, _tree, monkeypatch):
+    """Test that replans with execution history always call the LLM."""
+    monkeypatch.setattr(plan_cache_module, "_plan_cache", PlanCache())
+
+    mock_caller_cls.return_value.call_structured.return_value = LLMCallResult(
+        parsed=_make_plan(), usage=MagicMock(), duration_ms=1.0
+    )
+    llm = MagicMock()
+    mcp_executor = MagicMock()
+    mcp_executor.get_tool_schemas.return_value = {}
+    history = [TaskResult(task_id="task_1", success=False, error="boom")]
+
+    planner_node(llm, mcp_executor, _make_state(execution_results=history), plan_cache_enabled=True)
+    planner_node(llm, mcp_executor, _make_state(execution_results=history), plan_cache_enabled=True)
+
+    assert mock_caller_cls.return_value.call_structured.call_count == 2
+    assert len(plan_cache_module.get_plan_cache()) == 0
+
+
+@patch("asterism.agent.nodes.planner.context.get_workspace_tree_context", return_value="tree")
+@patch("asterism.agent.nodes.planner.node.LLMCaller")
+def test_planner_skips_cache_when_disabled(mock_caller_cls, _tree, monkeypatch):
+    """Test that repeated requests always call the LLM while plan caching is off."""
+    monkeypatch.setattr(plan_cache_module, "_plan_cache", PlanCache())
+
+    mock_caller_cls.return_value.call_structured.return_value = LLMCallResult(
+        parsed=_make_plan(), usage=MagicMock(), duration_ms=1.0
+    )
+    llm = MagicMock()
+    llm.model = "test-model"
+    mcp_executor = MagicMock()
+    mcp_executor.get_tool_schemas.return_value = {}
+
+    planner_node(llm, mcp_executor, _make_state())
+    planner_node(llm, mcp_executor, _make_state())
+
+    assert mock_caller_cls.return_value.call_structured.call_count == 2
+    assert len(plan_cache_module.get_plan_cache()) == 0
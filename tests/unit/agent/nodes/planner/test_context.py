@@ -0,0 +1,16 @@
+"""Test planner context building."""
+
+from asterism.agent.nodes.planner.context import _build_system_prompt
+from asterism.agent.nodes.planner.prompts import PLANNER_SYSTEM_PROMPT
+
+
+def test_system_prompt_keeps_stable_sections_first():
+    """Test that the volatile workspace tree comes after the tool list."""
+    before = _build_system_prompt("## Server: fs", "WORKSPACE STRUCTURE:\nold")
+    after = _build_system_prompt("## Server: fs", "WORKSPACE STRUCTURE:\nnew")
+
+    assert before.startswith(PLANNER_SYSTEM_PROMPT)
+    assert before.index("## Server: fs") < before.index("WORKSPACE STRUCTURE:")
+
+    prefix = before[: before.index("WORKSPACE STRUCTURE:")]
+    assert after.startswith(prefix)
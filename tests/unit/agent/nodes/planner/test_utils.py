@@ -0,0 +1,45 @@
+"""Test planner utility functions."""
+
+from asterism.agent.nodes.planner.utils import format_tools_context
+
+
+def _schemas() -> dict:
+    return {
+        "filesystem": [
+            {
+                "name": "read_file",
+                "description": "Read a file",
+                "inputSchema": {
+                    "properties": {"path": {"type": "string", "description": "File path"}},
+                    "required": ["path"],
+                },
+            }
+        ]
+    }
+
+
+def test_format_tools_context_renders_tools():
+    """Test that tools and parameters are rendered for the prompt."""
+    context = format_tools_context(_schemas())
+
+    assert "## Server: filesystem" in context
+    assert "### filesystem:read_file" in context
+    assert "  - path (string) (required): File path" in context
+
+
+def test_format_tools_context_empty():
+    """Test the placeholder for no tools."""
+    assert format_tools_context({}) == "No MCP tools available."
+
+
+def test_format_tools_context_reuses_result_for_same_schema_lists():
+    """Test that the formatted context is reused only while the schema lists are unchanged."""
+    schemas = _schemas()
+    first = format_tools_context(schemas)
+
+    assert format_tools_context(dict(schemas)) is first
+
+    updated = {"filesystem": [{"name": "write_file", "description": "Write a file"}]}
+    context = format_tools_context(updated)
+    assert "### filesystem:write_file" in context
+    assert "read_file" not in context
@@ -369,6 +369,27 @@ def test_are_dependencies_satisfied_not_met():
     assert satisfied is False
 
 
+def test_are_dependencies_satisfied_uses_precomputed_ids():
+    """Test that precomputed completed IDs are used instead of the state history."""
+    task = Task(id="task_3", description="Has deps", depends_on=["task_1", "task_2"])
+
+    state: AgentState = {
+        "session_id": "test",
+        "trace_id": "trace_123",
+        "messages": [],
+        "plan": None,
+        "current_task_index": 0,
+        "execution_results": [],
+        "evaluation_result": None,
+        "final_response": None,
+        "error": None,
+        "llm_usage": [],
+    }
+
+    assert are_dependencies_satisfied(task, state, {"task_1", "task_2"}) is True
+    assert are_dependencies_satisfied(task, state, {"task_1"}) is False
+
+
 def test_get_failed_tasks():
     """Test getting failed tasks."""
     state: AgentState = {
@@ -111,6 +111,18 @@ def test_generate_workspace_tree_ignores_patterns():
         assert "__pycache__" not in result
 
 
+def test_generate_workspace_tree_accepts_plain_set_patterns():
+    """Test that a mutable set of ignore patterns is accepted."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        (Path(tmpdir) / "main.py").touch()
+        (Path(tmpdir) / "debug.log").touch()
+
+        result = generate_workspace_tree(tmpdir, ignore_patterns={"*.log"})
+
+        assert "main.py" in result
+        assert "debug.log" not in result
+
+
 def test_generate_workspace_tree_max_depth():
     """Test max depth limitation."""
     with tempfile.TemporaryDirectory() as tmpdir:
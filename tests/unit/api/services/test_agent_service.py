@@ -0,0 +1,102 @@
+"""Test concurrent agent runs sharing one MCP executor."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import orjson
+
+from asterism.api.models import ChatCompletionRequest, ChatMessage
+from asterism.api.services.agent_service import AgentService
+from asterism.mcp.executor import MCPExecutor
+from asterism.mcp.transport_executor.stdio import StdioTransport
+
+
+class _FakeStdioServer:
+    """Stand-in MCP server process that answers stdio requests in order and records overlapping exchanges."""
+
+    def __init__(self):
+        self.stdin = MagicMock()
+        self.stdin.write.side_effect = self._write
+        self.stdout = MagicMock()
+        self.stdout.readline.side_effect = self._readline
+        self.stderr = iter(())
+        self.overlaps = 0
+        self._replies: list[bytes] = []
+        self._lock = threading.Lock()
+
+    def poll(self):
+        return None
+
+    def _write(self, data: bytes) -> None:
+        request = orjson.loads(data)
+        if "id" not in request:
+            return
+        if request["method"] == "tools/call":
+            result = {"content": [{"type": "text", "text": orjson.dumps(request["params"]["arguments"]).decode()}]}
+        elif request["method"] == "tools/list":
+            result = {"tools": [{"name": "read_file"}]}
+        else:
+            result = {}
+        with self._lock:
+            if self._replies:
+                self.overlaps += 1
+            self._replies.append(orjson.dumps({"jsonrpc": "2.0", "id": request["id"], "result": result}) + b"\n")
+
+    def _readline(self) -> bytes:
+        # Give a concurrent caller time to write before this reply is taken
+        time.sleep(0.05)
+        with self._lock:
+            return self._replies.pop(0)
+
+
+def _request(content: str) -> ChatCompletionRequest:
+    return ChatCompletionRequest(model="test/model", messages=[ChatMessage(role="user", content=content)])
+
+
+def test_concurrent_completions_share_one_stdio_server():
+    """Test two completions at once start the server once and each get their own tool result."""
+    servers = []
+
+    def popen(*args, **kwargs):
+        servers.append(_FakeStdioServer())
+        return servers[-1]
+
+    config = MagicMock()
+    config.is_server_enabled.return_value = True
+    config.get_server_metadata.return_value = {"transport": "stdio", "command": "server", "args": []}
+    with patch("asterism.mcp.executor.get_mcp_config", return_value=config):
+        executor = MCPExecutor()
+
+    class _ToolCallingAgent:
+        """Agent whose run is a single tool call named after its session."""
+
+        def __init__(self, mcp_executor, **kwargs):
+            self.mcp_executor = mcp_executor
+
+        def invoke(self, session_id, messages):
+            return self.mcp_executor.execute_tool("fs", "read_file", path=session_id)
+
+        def close(self):
+            pass
+
+    service = AgentService(llm_router=MagicMock(), mcp_executor=executor, config=MagicMock())
+
+    async def run_both():
+        return await asyncio.gather(
+            service.run_completion(_request("read a"), "a"),
+            service.run_completion(_request("read b"), "b"),
+        )
+
+    with (
+        patch("asterism.api.services.agent_service.Agent", _ToolCallingAgent),
+        patch("asterism.mcp.executor.create_transport", side_effect=lambda _: StdioTransport()),
+        patch("asterism.mcp.transport_executor.stdio.subprocess.Popen", side_effect=popen),
+    ):
+        first, second = asyncio.run(run_both())
+
+    assert len(servers) == 1
+    assert servers[0].overlaps == 0
+    assert first["result"] == {"path": "a"}
+    assert second["result"] == {"path": "b"}
@@ -0,0 +1,36 @@
+"""Test SystemPromptLoader file caching."""
+
+import os
+from unittest.mock import patch
+
+from asterism.core.prompt_loader import SystemPromptLoader
+
+
+def _make_loader(tmp_path) -> SystemPromptLoader:
+    soul = tmp_path / "SOUL.md"
+    agent = tmp_path / "AGENT.md"
+    soul.write_text("soul")
+    agent.write_text("agent")
+    return SystemPromptLoader(soul_path=str(soul), agent_path=str(agent))
+
+
+def test_load_reuses_unchanged_files(tmp_path):
+    """Test that unchanged files are not re-read."""
+    loader = _make_loader(tmp_path)
+    first = loader.load()
+
+    with patch("builtins.open", side_effect=AssertionError("file was re-read")):
+        assert loader.load() == first
+
+
+def test_load_reflects_runtime_updates(tmp_path):
+    """Test that an edited file is picked up on the next load."""
+    loader = _make_loader(tmp_path)
+    assert "soul" in loader.load()
+
+    soul = tmp_path / "SOUL.md"
+    soul.write_text("updated soul")
+    stat = soul.stat()
+    os.utime(soul, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert "updated soul" in loader.load()
@@ -4,6 +4,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+import asterism.mcp.executor as executor_module
 from asterism.mcp.executor import MCPExecutor, execute_mcp_tool, get_mcp_executor
 
 
@@ -31,6 +32,17 @@ def mock_transport():
     return transport
 
 
+@pytest.fixture
+def make_executor(mock_config):
+    """Build MCPExecutors on the mock config, optionally with constructor overrides."""
+
+    def _make(**kwargs) -> MCPExecutor:
+        with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
+            return MCPExecutor(**kwargs)
+
+    return _make
+
+
 class TestMCPExecutor:
     """Test cases for MCPExecutor class."""
 
@@ -208,8 +220,6 @@ class TestGlobalFunctions:
             mock_executor_class.return_value = mock_instance
 
             # Reset the global instance
-            import asterism.mcp.executor as executor_module
-
             executor_module._mcp_executor = None
 
             result1 = get_mcp_executor()
@@ -223,8 +233,6 @@ class TestGlobalFunctions:
         with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
             with patch("asterism.mcp.executor.create_transport", return_value=mock_transport):
                 # Reset the global instance to ensure fresh executor
-                import asterism.mcp.executor as executor_module
-
                 executor_module._mcp_executor = None
 
                 # Test valid tool
@@ -234,5 +242,172 @@ class TestGlobalFunctions:
                 assert result["tool"] == "filesystem:list_files"
 
 
+class TestExecuteToolsBatch:
+    """Test cases for MCPExecutor.execute_tools_batch."""
+
+    def test_batch_uses_execute_many_per_server(self, make_executor):
+        """Test that calls to one server share a single execute_many round trip."""
+        transport = MagicMock()
+        transport.execute_many.return_value = [{"success": True, "result": 1}, {"success": True, "result": 2}]
+        executor = make_executor()
+        executor.transports["http"] = transport
+        executor.tool_cache["http"] = ["read_file"]
+
+        results = executor.execute_tools_batch(
+            [("http", "read_file", {"path": "a"}), ("http", "read_file", {"path": "b"})]
+        )
+
+        transport.execute_many.assert_called_once_with([("read_file", {"path": "a"}), ("read_file", {"path": "b"})])
+        transport.execute_tool.assert_not_called()
+        assert [r["result"] for r in results] == [{"success": True, "result": 1}, {"success": True, "result": 2}]
+        assert all(r["tool_call"] == "http:read_file" for r in results)
+
+    def test_batch_falls_back_to_sequential_calls(self, make_executor):
+        """Test that transports without execute_many run calls one by one."""
+        transport = MagicMock(spec=["execute_tool", "list_tools"])
+        transport.execute_tool.side_effect = lambda tool_name, **kwargs: kwargs["path"]
+        executor = make_executor()
+        executor.transports["stdio"] = transport
+        executor.tool_cache["stdio"] = ["read_file"]
+
+        results = executor.execute_tools_batch(
+            [("stdio", "read_file", {"path": "a"}), ("stdio", "read_file", {"path": "b"})]
+        )
+
+        assert [r["result"] for r in results] == ["a", "b"]
+
+    def test_batch_keeps_order_and_reports_invalid_calls(self, make_executor):
+        """Test ordering across servers and per-call validation errors."""
+        first = MagicMock(spec=["execute_tool", "list_tools"])
+        first.execute_tool.return_value = "first"
+        second = MagicMock(spec=["execute_tool", "list_tools"])
+        second.execute_tool.return_value = "second"
+        executor = make_executor()
+        executor.transports.update({"one": first, "two": second})
+        executor.tool_cache.update({"one": ["tool"], "two": ["tool"]})
+
+        results = executor.execute_tools_batch([("two", "tool", {}), ("one", "missing", {}), ("one", "tool", {})])
+
+        assert results[0]["result"] == "second"
+        assert results[1]["success"] is False
+        assert "not found" in results[1]["error"]
+        assert results[2]["result"] == "first"
+
+    def test_batch_execute_many_failure_falls_back_to_single_calls(self, make_executor):
+        """Test that a group whose execute_many raises is retried one call at a time."""
+        transport = MagicMock()
+        transport.execute_many.side_effect = RuntimeError("connection lost")
+        transport.execute_tool.side_effect = lambda tool_name, **kwargs: kwargs["path"]
+        executor = make_executor()
+        executor.transports["http"] = transport
+        executor.tool_cache["http"] = ["read_file"]
+
+        results = executor.execute_tools_batch(
+            [("http", "read_file", {"path": "a"}), ("http", "read_file", {"path": "b"})]
+        )
+
+        assert [r["result"] for r in results] == ["a", "b"]
+        assert transport.execute_tool.call_count == 2
+
+    def test_batch_resends_only_concurrency_rejections(self, make_executor):
+        """Test that 409/429 rejections are re-sent singly after Retry-After while other failures are kept."""
+        transport = MagicMock()
+        transport.execute_many.return_value = [
+            {"success": False, "error": "HTTP error 429: Too Many Requests", "retry_after": 2.0},
+            {"success": True, "result": "b"},
+            {"success": False, "error": "HTTP error 400: Bad Request"},
+            {"success": False, "error": "HTTP error 504: Gateway Timeout"},
+            {"success": False, "error": "HTTP error 409: Conflict"},
+        ]
+        transport.execute_tool.side_effect = lambda tool_name, **kwargs: {"success": True, "result": kwargs["path"]}
+        executor = make_executor()
+        executor.transports["http"] = transport
+        executor.tool_cache["http"] = ["read_file"]
+
+        with patch("asterism.mcp.executor.time.sleep") as sleep:
+            results = executor.execute_tools_batch(
+                [("http", "read_file", {"path": name}) for name in ("a", "b", "c", "d", "e")]
+            )
+
+        sleep.assert_called_once_with(2.0)
+        assert [c.kwargs["path"] for c in transport.execute_tool.call_args_list] == ["a", "e"]
+        assert results[0]["result"] == {"success": True, "result": "a"}
+        assert results[1]["result"] == {"success": True, "result": "b"}
+        assert results[2]["result"] == {"success": False, "error": "HTTP error 400: Bad Request"}
+        assert results[3]["result"] == {"success": False, "error": "HTTP error 504: Gateway Timeout"}
+        assert results[4]["result"] == {"success": True, "result": "e"}
+
+    @pytest.mark.parametrize(("retry_after", "delay"), [(None, 0.5), (600.0, 30.0)])
+    def test_batch_resend_delay_defaults_and_is_capped(self, make_executor, retry_after, delay):
+        """Test that resends wait a short default without Retry-After and never longer than the cap."""
+        rejected = {"success": False, "error": "HTTP error 503: Service Unavailable"}
+        if retry_after is not None:
+            rejected["retry_after"] = retry_after
+        transport = MagicMock()
+        transport.execute_many.return_value = [rejected, {"success": True, "result": "b"}]
+        transport.execute_tool.return_value = {"success": True, "result": "a"}
+        executor = make_executor()
+        executor.transports["http"] = transport
+        executor.tool_cache["http"] = ["read_file"]
+
+        with patch("asterism.mcp.executor.time.sleep") as sleep:
+            executor.execute_tools_batch([("http", "read_file", {}), ("http", "read_file", {})])
+
+        sleep.assert_called_once_with(delay)
+
+
+class TestResultTruncation:
+    """Test cases for bounding tool result size."""
+
+    @pytest.fixture
+    def executor_with_result(self, make_executor):
+        """Build an executor whose fs transport returns the given result."""
+
+        def _make(result, **kwargs) -> MCPExecutor:
+            transport = MagicMock()
+            transport.execute_tool.return_value = result
+            executor = make_executor(**kwargs)
+            executor.transports["fs"] = transport
+            executor.tool_cache["fs"] = ["read_file"]
+            return executor
+
+        return _make
+
+    def test_large_text_result_is_truncated(self, executor_with_result):
+        """Test that oversized text is cut and flagged."""
+        executor = executor_with_result("x" * 100, max_result_chars=10)
+
+        result = executor.execute_tool("fs", "read_file", path="big.txt")
+
+        assert result["result"] == "x" * 10
+        assert result["truncated"] is True
+
+    def test_large_structured_result_keeps_its_shape(self, executor_with_result):
+        """Test that only oversized strings inside dict results are cut."""
+        output = {"success": True, "result": {"content": "y" * 100, "items": ["z" * 100, 3]}}
+        executor = executor_with_result(output, max_result_chars=20)
+
+        result = executor.execute_tool("fs", "read_file")
+
+        assert result["result"] == {"success": True, "result": {"content": "y" * 20, "items": ["z" * 20, 3]}}
+        assert result["truncated"] is True
+        assert output["result"]["content"] == "y" * 100
+
+    def test_small_result_is_untouched(self, executor_with_result):
+        """Test that results within the limit keep their type and carry no flag."""
+        executor = executor_with_result({"content": "small"})
+
+        result = executor.execute_tool("fs", "read_file")
+
+        assert result["result"] == {"content": "small"}
+        assert "truncated" not in result
+
+    def test_limit_can_be_disabled(self, executor_with_result):
+        """Test that None keeps results whole."""
+        executor = executor_with_result("z" * 100, max_result_chars=None)
+
+        assert executor.execute_tool("fs", "read_file")["result"] == "z" * 100
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,13 @@
+"""Shared fixtures for transport unit tests."""
+
+import pytest
+
+from asterism.mcp.transport_executor import http_session
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_http_session():
+    """Give each test a fresh shared session so patched ``requests.Session`` classes take effect."""
+    http_session._shared_session = None
+    yield
+    http_session._shared_session = None
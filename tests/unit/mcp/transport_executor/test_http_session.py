@@ -0,0 +1,76 @@
+"""Unit tests for the shared HTTP session factory."""
+
+from unittest.mock import MagicMock, patch
+
+from requests.adapters import HTTPAdapter
+
+from asterism.mcp.transport_executor.http_session import (
+    create_http_session,
+    read_error_body,
+    retry_after_seconds,
+    shared_http_session,
+)
+
+
+def test_create_http_session_mounts_retrying_adapter():
+    """Test both schemes share one adapter that retries only requests the server cannot have run."""
+    session = create_http_session()
+
+    adapter = session.get_adapter("http://localhost:3000")
+    assert isinstance(adapter, HTTPAdapter)
+    assert session.get_adapter("https://localhost:3000") is adapter
+
+    retry = adapter.max_retries
+    assert retry.total == 3
+    assert retry.connect == 3
+    assert retry.read == 0
+    assert retry.backoff_factor == 0.2
+    assert set(retry.status_forcelist) == {503}
+    assert retry.allowed_methods == frozenset({"GET"})
+    assert retry.respect_retry_after_header is True
+    assert retry.raise_on_status is False
+    session.close()
+
+
+def test_retry_never_resends_tool_call_posts():
+    """Test that POSTs are not retried after a read timeout or an error status."""
+    retry = create_http_session().get_adapter("http://localhost:3000").max_retries
+
+    assert not retry.is_retry("POST", 503, has_retry_after=True)
+    assert not retry.is_retry("POST", 502)
+    assert retry.is_retry("GET", 503, has_retry_after=True)
+    assert not retry.is_retry("GET", 504)
+
+
+def test_shared_http_session_is_created_once():
+    """Test the shared session is built lazily and then reused."""
+    with patch("asterism.mcp.transport_executor.http_session.create_http_session") as mock_create:
+        first = shared_http_session()
+        second = shared_http_session()
+
+    mock_create.assert_called_once()
+    assert first is second is mock_create.return_value
+
+
+def test_read_error_body_reads_bounded_prefix_and_closes():
+    """Test only a bounded prefix of the error body is read and the response is released."""
+    response = MagicMock()
+    response.raw.read.return_value = b"Bad gateway \xff"
+
+    assert read_error_body(response) == "Bad gateway \ufffd"
+    response.raw.read.assert_called_once_with(4096, decode_content=True)
+    response.close.assert_called_once()
+
+
+def test_retry_after_seconds_parses_delays_and_dates():
+    """Test Retry-After is read as seconds or an HTTP date, and ignored when absent or invalid."""
+
+    def response(headers):
+        mock = MagicMock()
+        mock.headers = headers
+        return mock
+
+    assert retry_after_seconds(response({"Retry-After": "3"})) == 3.0
+    assert retry_after_seconds(response({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})) == 0.0
+    assert retry_after_seconds(response({"Retry-After": "soon"})) is None
+    assert retry_after_seconds(response({})) is None
@@ -1,6 +1,8 @@
 """Unit tests for HTTPStreamTransport."""
 
-from unittest.mock import MagicMock, patch
+import json
+import threading
+from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
 
@@ -29,9 +31,7 @@ def test_http_stream_start_success(mock_session_class):
     mock_response = MagicMock()
     mock_response.ok = True
     mock_response.headers = {"mcp-session-id": "test-session-123"}
-    mock_response.iter_lines.return_value = [
-        b'data: {"jsonrpc": "2.0", "id": 1, "result": {"protocolVersion": "2024-11-05"}}'
-    ]
+    mock_response.content = b'data: {"jsonrpc": "2.0", "id": 1, "result": {"protocolVersion": "2024-11-05"}}'
     mock_response.__enter__ = MagicMock(return_value=mock_response)
     mock_response.__exit__ = MagicMock(return_value=False)
     mock_session.post.return_value = mock_response
@@ -45,6 +45,92 @@ def test_http_stream_start_success(mock_session_class):
     assert transport._session_id == "test-session-123"
 
 
+@patch("asterism.mcp.transport_executor.http_stream.requests.Session")
+def test_http_stream_reuses_cached_headers(mock_session_class):
+    """Test every request reuses one cached headers dict that carries the session ID."""
+    mock_session = MagicMock()
+    mock_session_class.return_value = mock_session
+
+    mock_response = MagicMock()
+    mock_response.ok = True
+    mock_response.headers = {"mcp-session-id": "test-session-123"}
+    mock_response.content = b'data: {"jsonrpc": "2.0", "id": 1, "result": {"protocolVersion": "2024-11-05"}}'
+    mock_response.__enter__ = MagicMock(return_value=mock_response)
+    mock_response.__exit__ = MagicMock(return_value=False)
+    mock_session.post.return_value = mock_response
+
+    transport = HTTPStreamTransport()
+    transport.start("http", ["http://localhost:3000"])
+    transport.list_tools()
+    transport.list_tools()
+
+    mock_session.headers.update.assert_not_called()
+    assert mock_session.post.call_args_list[0].kwargs["headers"] == {
+        "Accept": "application/json, text/event-stream",
+        "Content-Type": "application/json",
+    }
+    message_headers = [c.kwargs["headers"] for c in mock_session.post.call_args_list[1:]]
+    assert all(h is transport._message_headers for h in message_headers)
+    assert transport._message_headers == {
+        "Accept": "application/json, text/event-stream",
+        "Content-Type": "application/json",
+        "mcp-session-id": "test-session-123",
+    }
+
+
+@patch("asterism.mcp.transport_executor.http_stream.requests.Session")
+def test_http_stream_initialized_notification_keeps_connection_pooled(mock_session_class):
+    """Test the initialized notification is sent unstreamed so its connection is reused."""
+    mock_session = MagicMock()
+    mock_session_class.return_value = mock_session
+
+    mock_init_response = MagicMock()
+    mock_init_response.ok = True
+    mock_init_response.headers = {"mcp-session-id": "test-session-123"}
+    mock_init_response.content = b'data: {"jsonrpc": "2.0", "id": 1, "result": {"protocolVersion": "2024-11-05"}}'
+    mock_init_response.__enter__ = MagicMock(return_value=mock_init_response)
+    mock_init_response.__exit__ = MagicMock(return_value=False)
+
+    mock_notification_response = MagicMock()
+
+    mock_session.post.side_effect = [mock_init_response, mock_notification_response]
+
+    transport = HTTPStreamTransport()
+    transport.start("http", ["http://localhost:3000"])
+
+    notification_call = mock_session.post.call_args
+    assert "stream" not in notification_call.kwargs
+    mock_notification_response.close.assert_not_called()
+    assert json.loads(notification_call.kwargs["data"]) == {"jsonrpc": "2.0", "method": "notifications/initialized"}
+
+
+@pytest.mark.parametrize(
+    ("ok", "headers", "message"),
+    [
+        (False, {"mcp-session-id": "test-session-123"}, "HTTP initialization failed: 500"),
+        (True, {}, "No session ID received from server"),
+    ],
+)
+@patch("asterism.mcp.transport_executor.http_stream.requests.Session")
+def test_http_stream_failed_handshake_releases_response(mock_session_class, ok, headers, message):
+    """Test a rejected handshake still closes its streamed response so the connection is not leaked."""
+    mock_session = MagicMock()
+    mock_session_class.return_value = mock_session
+    mock_response = MagicMock()
+    mock_response.ok = ok
+    mock_response.status_code = 500
+    mock_response.headers = headers
+    mock_response.__enter__ = MagicMock(return_value=mock_response)
+    mock_response.__exit__ = MagicMock(return_value=False)
+    mock_session.post.return_value = mock_response
+
+    transport = HTTPStreamTransport()
+    with pytest.raises(RuntimeError, match=message):
+        transport.start("http", ["http://localhost:3000"])
+
+    mock_response.__exit__.assert_called_once()
+
+
 @patch("asterism.mcp.transport_executor.http_stream.requests.Session")
 def test_http_stream_start_without_args_raises(mock_session_class):
     """Test start raises ValueError when args is empty."""
@@ -64,23 +150,19 @@ def test_http_stream_execute_tool_success(mock_session_class):
     mock_init_response = MagicMock()
     mock_init_response.ok = True
     mock_init_response.headers = {"mcp-session-id": "test-session-123"}
-    mock_init_response.iter_lines.return_value = [
-        b'data: {"jsonrpc": "2.0", "id": 1, "result": {"protocolVersion": "2024-11-05"}}'
-    ]
+    mock_init_response.content = b'data: {"jsonrpc": "2.0", "id": 1, "result": {"protocolVersion": "2024-11-05"}}'
     mock_init_response.__enter__ = MagicMock(return_value=mock_init_response)
     mock_init_response.__exit__ = MagicMock(return_value=False)
 
     mock_notification_response = MagicMock()
     mock_notification_response.ok = True
-    mock_notification_response.iter_lines.return_value = []
+    mock_notification_response.content = b""
     mock_notification_response.__enter__ = MagicMock(return_value=mock_notification_response)
     mock_notification_response.__exit__ = MagicMock(return_value=False)
 
     mock_tool_response = MagicMock()
     mock_tool_response.ok = True
-    mock_tool_response.iter_lines.return_value = [
-        b'data: {"jsonrpc": "2.0", "id": 3, "result": {"content": [{"type": "text", "text": "{\\"result\\": \\"success\\"}"}]}}'  # noqa: E501
-    ]
+    mock_tool_response.content = b'data: {"jsonrpc": "2.0", "id": 3, "result": {"content": [{"type": "text", "text": "{\\"result\\": \\"success\\"}"}]}}'  # noqa: E501
     mock_tool_response.__enter__ = MagicMock(return_value=mock_tool_response)
     mock_tool_response.__exit__ = MagicMock(return_value=False)
 
@@ -106,23 +188,21 @@ def test_http_stream_list_tools_success(mock_session_class):
     mock_init_response = MagicMock()
     mock_init_response.ok = True
     mock_init_response.headers = {"mcp-session-id": "test-session-123"}
-    mock_init_response.iter_lines.return_value = [
-        b'data: {"jsonrpc": "2.0", "id": 1, "result": {"protocolVersion": "2024-11-05"}}'
-    ]
+    mock_init_response.content = b'data: {"jsonrpc": "2.0", "id": 1, "result": {"protocolVersion": "2024-11-05"}}'
     mock_init_response.__enter__ = MagicMock(return_value=mock_init_response)
     mock_init_response.__exit__ = MagicMock(return_value=False)
 
     mock_notification_response = MagicMock()
     mock_notification_response.ok = True
-    mock_notification_response.iter_lines.return_value = []
+    mock_notification_response.content = b""
     mock_notification_response.__enter__ = MagicMock(return_value=mock_notification_response)
     mock_notification_response.__exit__ = MagicMock(return_value=False)
 
     mock_list_response = MagicMock()
     mock_list_response.ok = True
-    mock_list_response.iter_lines.return_value = [
+    mock_list_response.content = (
         b'data: {"jsonrpc": "2.0", "id": 3, "result": {"tools": [{"name": "tool1"}, {"name": "tool2"}]}}'
-    ]
+    )
     mock_list_response.__enter__ = MagicMock(return_value=mock_list_response)
     mock_list_response.__exit__ = MagicMock(return_value=False)
 
@@ -151,9 +231,7 @@ def test_http_stream_is_alive(mock_session_class):
     mock_response = MagicMock()
     mock_response.ok = True
     mock_response.headers = {"mcp-session-id": "test-session-123"}
-    mock_response.iter_lines.return_value = [
-        b'data: {"jsonrpc": "2.0", "id": 1, "result": {"protocolVersion": "2024-11-05"}}'
-    ]
+    mock_response.content = b'data: {"jsonrpc": "2.0", "id": 1, "result": {"protocolVersion": "2024-11-05"}}'
     mock_response.__enter__ = MagicMock(return_value=mock_response)
     mock_response.__exit__ = MagicMock(return_value=False)
     mock_session.post.return_value = mock_response
@@ -166,8 +244,8 @@ def test_http_stream_is_alive(mock_session_class):
 
 
 @patch("asterism.mcp.transport_executor.http_stream.requests.Session")
-def test_http_stream_stop_closes_session(mock_session_class):
-    """Test stop closes the session."""
+def test_http_stream_stop_releases_shared_session(mock_session_class):
+    """Test stop drops the session reference but leaves the shared pool open."""
     mock_session = MagicMock()
     mock_session_class.return_value = mock_session
 
@@ -175,9 +253,7 @@ def test_http_stream_stop_closes_session(mock_session_class):
     mock_response = MagicMock()
     mock_response.ok = True
     mock_response.headers = {"mcp-session-id": "test-session-123"}
-    mock_response.iter_lines.return_value = [
-        b'data: {"jsonrpc": "2.0", "id": 1, "result": {"protocolVersion": "2024-11-05"}}'
-    ]
+    mock_response.content = b'data: {"jsonrpc": "2.0", "id": 1, "result": {"protocolVersion": "2024-11-05"}}'
     mock_response.__enter__ = MagicMock(return_value=mock_response)
     mock_response.__exit__ = MagicMock(return_value=False)
     mock_session.post.return_value = mock_response
@@ -186,7 +262,7 @@ def test_http_stream_stop_closes_session(mock_session_class):
     transport.start("http", ["http://localhost:3000"])
     transport.stop()
 
-    mock_session.close.assert_called_once()
+    mock_session.close.assert_not_called()
     assert transport._session is None
     assert transport._base_url is None
     assert transport._initialized is False
@@ -202,23 +278,21 @@ def test_http_stream_execute_tool_non_json_response(mock_session_class):
     mock_init_response = MagicMock()
     mock_init_response.ok = True
     mock_init_response.headers = {"mcp-session-id": "test-session-123"}
-    mock_init_response.iter_lines.return_value = [
-        b'data: {"jsonrpc": "2.0", "id": 1, "result": {"protocolVersion": "2024-11-05"}}'
-    ]
+    mock_init_response.content = b'data: {"jsonrpc": "2.0", "id": 1, "result": {"protocolVersion": "2024-11-05"}}'
     mock_init_response.__enter__ = MagicMock(return_value=mock_init_response)
     mock_init_response.__exit__ = MagicMock(return_value=False)
 
     mock_notification_response = MagicMock()
     mock_notification_response.ok = True
-    mock_notification_response.iter_lines.return_value = []
+    mock_notification_response.content = b""
     mock_notification_response.__enter__ = MagicMock(return_value=mock_notification_response)
     mock_notification_response.__exit__ = MagicMock(return_value=False)
 
     mock_tool_response = MagicMock()
     mock_tool_response.ok = True
-    mock_tool_response.iter_lines.return_value = [
+    mock_tool_response.content = (
         b'data: {"jsonrpc": "2.0", "id": 3, "result": {"content": [{"type": "text", "text": "plain text result"}]}}'
-    ]
+    )
     mock_tool_response.__enter__ = MagicMock(return_value=mock_tool_response)
     mock_tool_response.__exit__ = MagicMock(return_value=False)
 
@@ -243,21 +317,19 @@ def test_http_stream_execute_tool_empty_content(mock_session_class):
     mock_init_response = MagicMock()
     mock_init_response.ok = True
     mock_init_response.headers = {"mcp-session-id": "test-session-123"}
-    mock_init_response.iter_lines.return_value = [
-        b'data: {"jsonrpc": "2.0", "id": 1, "result": {"protocolVersion": "2024-11-05"}}'
-    ]
+    mock_init_response.content = b'data: {"jsonrpc": "2.0", "id": 1, "result": {"protocolVersion": "2024-11-05"}}'
     mock_init_response.__enter__ = MagicMock(return_value=mock_init_response)
     mock_init_response.__exit__ = MagicMock(return_value=False)
 
     mock_notification_response = MagicMock()
     mock_notification_response.ok = True
-    mock_notification_response.iter_lines.return_value = []
+    mock_notification_response.content = b""
     mock_notification_response.__enter__ = MagicMock(return_value=mock_notification_response)
     mock_notification_response.__exit__ = MagicMock(return_value=False)
 
     mock_tool_response = MagicMock()
     mock_tool_response.ok = True
-    mock_tool_response.iter_lines.return_value = [b'data: {"jsonrpc": "2.0", "id": 3, "result": {"content": []}}']
+    mock_tool_response.content = b'data: {"jsonrpc": "2.0", "id": 3, "result": {"content": []}}'
     mock_tool_response.__enter__ = MagicMock(return_value=mock_tool_response)
     mock_tool_response.__exit__ = MagicMock(return_value=False)
 
@@ -272,6 +344,154 @@ def test_http_stream_execute_tool_empty_content(mock_session_class):
     assert result["result"] == {}
 
 
+@patch("asterism.mcp.transport_executor.http_stream.requests.Session")
+def test_http_stream_plain_json_response_is_read_once_and_parsed(mock_session_class):
+    """Test application/json responses are parsed from the body in one read."""
+    mock_session = MagicMock()
+    mock_session_class.return_value = mock_session
+
+    mock_init_response = MagicMock()
+    mock_init_response.ok = True
+    mock_init_response.headers = {"mcp-session-id": "test-session-123", "Content-Type": "application/json"}
+    mock_init_response.content = b'{"jsonrpc": "2.0", "id": 1, "result": {"protocolVersion": "2024-11-05"}}'
+    mock_init_response.__enter__ = MagicMock(return_value=mock_init_response)
+    mock_init_response.__exit__ = MagicMock(return_value=False)
+
+    mock_notification_response = MagicMock()
+    mock_notification_response.ok = True
+    mock_notification_response.headers = {"Content-Type": "application/json"}
+    mock_notification_response.content = b""
+    mock_notification_response.__enter__ = MagicMock(return_value=mock_notification_response)
+    mock_notification_response.__exit__ = MagicMock(return_value=False)
+
+    mock_list_response = MagicMock()
+    mock_list_response.ok = True
+    mock_list_response.headers = {"Content-Type": "application/json"}
+    # Pretty-printed JSON spans lines, so only the plain JSON parser can decode it
+    list_body = json.dumps({"jsonrpc": "2.0", "id": 2, "result": {"tools": [{"name": "tool1"}]}}, indent=2)
+    list_content = PropertyMock(return_value=list_body.encode())
+    type(mock_list_response).content = list_content
+    mock_list_response.__enter__ = MagicMock(return_value=mock_list_response)
+    mock_list_response.__exit__ = MagicMock(return_value=False)
+
+    mock_session.post.side_effect = [mock_init_response, mock_notification_response, mock_list_response]
+
+    transport = HTTPStreamTransport()
+    transport.start("http", ["http://localhost:3000"])
+
+    assert transport._initialized is True
+    assert transport.list_tools() == ["tool1"]
+    list_content.assert_called_once_with()
+
+
+@patch("asterism.mcp.transport_executor.http_stream.requests.Session")
+def test_http_stream_transports_share_one_session(mock_session_class):
+    """Test separate transport instances pool connections through one session."""
+    mock_session = MagicMock()
+    mock_session_class.return_value = mock_session
+    mock_response = MagicMock()
+    mock_response.ok = True
+    mock_response.headers = {"mcp-session-id": "test-session-123"}
+    mock_response.content = b'data: {"jsonrpc": "2.0", "id": 1, "result": {}}'
+    mock_response.__enter__ = MagicMock(return_value=mock_response)
+    mock_response.__exit__ = MagicMock(return_value=False)
+    mock_session.post.return_value = mock_response
+
+    first, second = HTTPStreamTransport(), HTTPStreamTransport()
+    first.start("http", ["http://localhost:3000"])
+    second.start("http", ["http://localhost:4000"])
+
+    mock_session_class.assert_called_once()
+    assert first._session is second._session
+
+
+def test_http_stream_parse_tool_result_single_and_multiple_blocks():
+    """Test a lone text block is parsed directly and several blocks are joined first."""
+    transport = HTTPStreamTransport()
+
+    single = {"result": {"content": [{"type": "text", "text": '{"a": 1}'}]}}
+    multiple = {
+        "result": {
+            "content": [
+                {"type": "text", "text": '{"a": '},
+                {"type": "image", "data": "..."},
+                {"type": "text", "text": "2}"},
+            ]
+        }
+    }
+
+    assert transport._parse_tool_result(single) == {"success": True, "result": {"a": 1}}
+    assert transport._parse_tool_result(multiple) == {"success": True, "result": {"a": 2}}
+
+
+def test_http_stream_parse_stream_response_skips_non_data_lines():
+    """Test the SSE scan ignores event/comment lines and keeps the last JSON payload."""
+    response = MagicMock()
+    response.content = (
+        b": keep-alive\r\n"
+        b"event: message\r\n"
+        b'data: {"jsonrpc": "2.0", "id": 1, "result": {"step": 1}}\r\n'
+        b"\r\n"
+        b"data: {not json}\n"
+        b"event: message\n"
+        b'data:{"jsonrpc": "2.0", "id": 1, "result": {"step": 2}}\n'
+    )
+
+    transport = HTTPStreamTransport()
+
+    assert transport._parse_stream_response(response) == {"jsonrpc": "2.0", "id": 1, "result": {"step": 2}}
+
+
+def _json_response(body: bytes, ok: bool = True, status_code: int = 200) -> MagicMock:
+    response = MagicMock()
+    response.ok = ok
+    response.status_code = status_code
+    response.headers = {"Content-Type": "application/json"}
+    response.content = body
+    response.raw.read.return_value = body
+    response.__enter__ = MagicMock(return_value=response)
+    response.__exit__ = MagicMock(return_value=False)
+    return response
+
+
+def test_http_stream_execute_many_sends_concurrent_single_requests():
+    """Test each call is its own JSON-RPC request, all in flight at once, never a batch array."""
+    transport = HTTPStreamTransport()
+    transport._session = MagicMock()
+    transport._base_url = "http://localhost:3000"
+    transport._mcp_url = "http://localhost:3000/mcp"
+    transport._initialized = True
+    transport._request_id = 1
+
+    replies = {
+        2: _json_response(
+            b'{"jsonrpc": "2.0", "id": 2, "result": {"content": [{"type": "text", "text": "{\\"n\\": 1}"}]}}'
+        ),
+        3: _json_response(b'{"jsonrpc": "2.0", "id": 3, "error": {"code": -32602, "message": "bad args"}}'),
+        4: _json_response(b"busy", ok=False, status_code=503),
+    }
+    replies[4].headers["Retry-After"] = "2"
+    all_in_flight = threading.Barrier(3, timeout=5)
+
+    def post(*args, **kwargs):
+        request = json.loads(kwargs["data"])
+        all_in_flight.wait()
+        return replies[request["id"]]
+
+    transport._session.post.side_effect = post
+
+    results = transport.execute_many([("first", {"a": 1}), ("second", {}), ("third", {})])
+
+    requests_sent = sorted(
+        (json.loads(c.kwargs["data"]) for c in transport._session.post.call_args_list), key=lambda r: r["id"]
+    )
+    assert [request["id"] for request in requests_sent] == [2, 3, 4]
+    assert requests_sent[0]["params"] == {"name": "first", "arguments": {"a": 1}}
+    assert results[0] == {"success": True, "result": {"n": 1}}
+    assert results[1] == {"success": False, "error": {"code": -32602, "message": "bad args"}}
+    assert results[2] == {"success": False, "error": "HTTP error 503: busy", "retry_after": 2.0}
+
+
 @patch("asterism.mcp.transport_executor.http_stream.requests.Session")
 def test_http_stream_list_tools_not_initialized_returns_empty(mock_session_class):
     """Test list_tools returns empty list when not initialized."""
@@ -282,9 +502,7 @@ def test_http_stream_list_tools_not_initialized_returns_empty(mock_session_class
     mock_response = MagicMock()
     mock_response.ok = True
     mock_response.headers = {"mcp-session-id": "test-session-123"}
-    mock_response.iter_lines.return_value = [
-        b'data: {"jsonrpc": "2.0", "id": 1, "result": {"protocolVersion": "2024-11-05"}}'
-    ]
+    mock_response.content = b'data: {"jsonrpc": "2.0", "id": 1, "result": {"protocolVersion": "2024-11-05"}}'
     mock_response.__enter__ = MagicMock(return_value=mock_response)
     mock_response.__exit__ = MagicMock(return_value=False)
     mock_session.post.return_value = mock_response
@@ -299,3 +517,14 @@ def test_http_stream_list_tools_not_initialized_returns_empty(mock_session_class
 
 if __name__ == "__main__":
     pytest.main([__file__])
+
+
+def test_http_stream_list_tools_requests_are_independent():
+    """Test each tools/list request is a new dict, so earlier requests never change."""
+    transport = HTTPStreamTransport()
+    first = transport._build_list_tools_request(1)
+    second = transport._build_list_tools_request(2)
+
+    assert first is not second
+    assert first["id"] == 1
+    assert second["id"] == 2
@@ -1,20 +1,36 @@
 """Unit tests for SSETransport."""
 
+import gzip
+import io
 import json
-from unittest.mock import MagicMock, patch
+import logging
+import threading
+from concurrent.futures import Future
+from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
+from urllib3.response import HTTPResponse
 
 from asterism.mcp.transport_executor.sse import SSETransport
 
 
+def _deliver_on_post(transport, mock_session, post_response, response_data):
+    """Make each mocked POST push ``response_data`` through the SSE listener path."""
+
+    def post(*args, **kwargs):
+        transport._process_sse_data(json.dumps(response_data).encode())
+        return post_response
+
+    mock_session.post.side_effect = post
+
+
 def test_sse_transport_init():
     """Test SSETransport initialization."""
     transport = SSETransport()
     assert transport._session is None
     assert transport._base_url is None
     assert transport._timeout == 30
-    assert transport._request_id == 0
+    assert transport._next_request_id() == 1
     assert transport._initialized is False
     assert transport._message_endpoint is None
 
@@ -32,27 +48,47 @@ def test_sse_start_success(mock_thread_class, mock_session_class):
     mock_thread_class.return_value = mock_thread
 
     transport = SSETransport()
-    # Set message endpoint manually (normally set by SSE listener)
-    transport._message_endpoint = "http://localhost:3000/message"
+    # Deliver the endpoint event as soon as the listener thread starts
+    mock_thread.start.side_effect = lambda: transport._process_sse_data(b"/message")
 
-    # Pre-populate response queue with init response
-    transport._response_queue.put(
+    # Deliver the init response through the listener once the request is posted
+    mock_post_response = MagicMock()
+    mock_post_response.ok = True
+    _deliver_on_post(
+        transport,
+        mock_session,
+        mock_post_response,
         {
             "jsonrpc": "2.0",
             "id": 1,
             "result": {"protocolVersion": "2024-11-05"},
-        }
+        },
     )
 
-    # Mock time.sleep to avoid actual sleep
-    with patch("time.sleep"):
-        transport.start("http", ["http://localhost:3000"])
+    transport.start("http", ["http://localhost:3000"])
 
     assert transport._base_url == "http://localhost:3000"
+    assert transport._message_endpoint == "http://localhost:3000/message"
     assert transport._session is not None
     assert transport._initialized is True
 
 
+@patch("asterism.mcp.transport_executor.sse.requests.Session")
+@patch("asterism.mcp.transport_executor.sse.threading.Thread")
+def test_sse_start_fails_fast_when_listener_exits(mock_thread_class, mock_session_class):
+    """Test the handshake stops waiting once the listener exits without an endpoint."""
+    mock_thread = MagicMock()
+    mock_thread_class.return_value = mock_thread
+
+    transport = SSETransport()
+    mock_thread.start.side_effect = lambda: transport._endpoint_ready.set()
+
+    with pytest.raises(RuntimeError, match="Failed to get message endpoint from SSE"):
+        transport.start("http", ["http://localhost:3000"])
+
+    mock_session_class.return_value.get.assert_not_called()
+
+
 @patch("asterism.mcp.transport_executor.sse.requests.Session")
 def test_sse_start_without_args_raises(mock_session_class):
     """Test start raises ValueError when args is empty."""
@@ -72,22 +108,20 @@ def test_sse_execute_tool_success(mock_session_class):
     mock_post_response = MagicMock()
     mock_post_response.ok = True
     mock_post_response.json.return_value = {"result": "posted"}
-    mock_session.post.return_value = mock_post_response
 
     transport = SSETransport()
     transport._base_url = "http://localhost:3000"
     transport._session = mock_session
     transport._message_endpoint = "http://localhost:3000/message"
     transport._initialized = True
-    transport._request_id = 1
 
-    # Put response in queue
+    # Deliver response through the listener when the request is posted
     response_data = {
         "jsonrpc": "2.0",
-        "id": 2,
+        "id": 1,
         "result": {"content": [{"type": "text", "text": json.dumps({"result": "success"})}]},
     }
-    transport._response_queue.put(response_data)
+    _deliver_on_post(transport, mock_session, mock_post_response, response_data)
 
     result = transport.execute_tool("test_tool", param1="value1")
 
@@ -105,22 +139,20 @@ def test_sse_list_tools_success(mock_session_class):
     # Setup mock response
     mock_post_response = MagicMock()
     mock_post_response.ok = True
-    mock_session.post.return_value = mock_post_response
 
     transport = SSETransport()
     transport._base_url = "http://localhost:3000"
     transport._session = mock_session
     transport._message_endpoint = "http://localhost:3000/message"
     transport._initialized = True
-    transport._request_id = 1
 
-    # Put response in queue
+    # Deliver response through the listener when the request is posted
     response_data = {
         "jsonrpc": "2.0",
-        "id": 2,
+        "id": 1,
         "result": {"tools": [{"name": "tool1"}, {"name": "tool2"}]},
     }
-    transport._response_queue.put(response_data)
+    _deliver_on_post(transport, mock_session, mock_post_response, response_data)
 
     tools = transport.list_tools()
 
@@ -144,8 +176,8 @@ def test_sse_is_alive(mock_session_class):
 
 @patch("asterism.mcp.transport_executor.sse.requests.Session")
 @patch("asterism.mcp.transport_executor.sse.threading.Thread")
-def test_sse_stop_closes_session(mock_thread_class, mock_session_class):
-    """Test stop closes session and stops thread."""
+def test_sse_stop_closes_stream_and_keeps_shared_session(mock_thread_class, mock_session_class):
+    """Test stop closes the event stream and stops the thread without closing the shared session."""
     mock_session = MagicMock()
     mock_session_class.return_value = mock_session
 
@@ -157,12 +189,17 @@ def test_sse_stop_closes_session(mock_thread_class, mock_session_class):
     transport._base_url = "http://localhost:3000"
     transport._session = mock_session
     transport._sse_thread = mock_thread
+    mock_stream = MagicMock()
+    transport._sse_response = mock_stream
     transport._message_endpoint = "http://localhost:3000/message"
     transport._initialized = True
 
     transport.stop()
 
-    mock_session.close.assert_called_once()
+    mock_stream.close.assert_called_once()
+    mock_thread.join.assert_called_once()
+    mock_session.close.assert_not_called()
+    assert transport._sse_response is None
     assert transport._session is None
     assert transport._base_url is None
     assert transport._initialized is False
@@ -177,22 +214,20 @@ def test_sse_execute_tool_non_json_response(mock_session_class):
 
     mock_post_response = MagicMock()
     mock_post_response.ok = True
-    mock_session.post.return_value = mock_post_response
 
     transport = SSETransport()
     transport._base_url = "http://localhost:3000"
     transport._session = mock_session
     transport._message_endpoint = "http://localhost:3000/message"
     transport._initialized = True
-    transport._request_id = 1
 
-    # Put response with non-JSON text in queue
+    # Deliver response with non-JSON text through the listener
     response_data = {
         "jsonrpc": "2.0",
-        "id": 2,
+        "id": 1,
         "result": {"content": [{"type": "text", "text": "plain text result"}]},
     }
-    transport._response_queue.put(response_data)
+    _deliver_on_post(transport, mock_session, mock_post_response, response_data)
 
     result = transport.execute_tool("test_tool")
 
@@ -208,22 +243,20 @@ def test_sse_execute_tool_empty_content(mock_session_class):
 
     mock_post_response = MagicMock()
     mock_post_response.ok = True
-    mock_session.post.return_value = mock_post_response
 
     transport = SSETransport()
     transport._base_url = "http://localhost:3000"
     transport._session = mock_session
     transport._message_endpoint = "http://localhost:3000/message"
     transport._initialized = True
-    transport._request_id = 1
 
-    # Put response with empty content in queue
+    # Deliver response with empty content through the listener
     response_data = {
         "jsonrpc": "2.0",
-        "id": 2,
+        "id": 1,
         "result": {"content": []},
     }
-    transport._response_queue.put(response_data)
+    _deliver_on_post(transport, mock_session, mock_post_response, response_data)
 
     result = transport.execute_tool("test_tool")
 
@@ -231,6 +264,249 @@ def test_sse_execute_tool_empty_content(mock_session_class):
     assert result["result"] == {}
 
 
+@patch("asterism.mcp.transport_executor.sse.requests.Session")
+def test_sse_execute_tool_http_error_reads_bounded_body(mock_session_class):
+    """Test an HTTP error reports a bounded body prefix and releases the pending request."""
+    mock_session = MagicMock()
+    mock_post_response = MagicMock()
+    mock_post_response.ok = False
+    mock_post_response.status_code = 502
+    mock_post_response.raw.read.return_value = b"<html>bad gateway</html>"
+    mock_session.post.return_value = mock_post_response
+
+    transport = SSETransport()
+    transport._base_url = "http://localhost:3000"
+    transport._session = mock_session
+    transport._message_endpoint = "http://localhost:3000/message"
+    transport._initialized = True
+
+    result = transport.execute_tool("test_tool")
+
+    assert result == {"success": False, "error": "HTTP error 502: <html>bad gateway</html>"}
+    mock_post_response.close.assert_called_once()
+    assert transport._pending == {}
+
+
+def test_sse_execute_many_posts_all_requests_before_waiting():
+    """Test batched calls are all in flight together and matched to replies by ID."""
+    mock_session = MagicMock()
+    transport = SSETransport()
+    transport._base_url = "http://localhost:3000"
+    transport._session = mock_session
+    transport._message_endpoint = "http://localhost:3000/message"
+    transport._initialized = True
+
+    in_flight = []
+    ok_response = MagicMock()
+    ok_response.ok = True
+    failed_response = MagicMock()
+    failed_response.ok = False
+    failed_response.status_code = 503
+    failed_response.headers = {"Retry-After": "2"}
+    failed_response.raw.read.return_value = b"busy"
+
+    def post(*args, **kwargs):
+        in_flight.append(len(transport._pending))
+        request_id = json.loads(kwargs["data"])["id"]
+        if request_id == 2:
+            return failed_response
+        if request_id == 3:
+            # Reply to both successful requests, newest first, once the last one is posted
+            for rid in (3, 1):
+                text = json.dumps({"n": rid})
+                reply = {"jsonrpc": "2.0", "id": rid, "result": {"content": [{"type": "text", "text": text}]}}
+                transport._process_sse_data(json.dumps(reply).encode())
+        return ok_response
+
+    mock_session.post.side_effect = post
+
+    results = transport.execute_many([("first", {}), ("second", {}), ("third", {"x": 1})])
+
+    assert in_flight == [1, 2, 2]
+    assert results == [
+        {"success": True, "result": {"n": 1}},
+        {"success": False, "error": "HTTP error 503: busy", "retry_after": 2.0},
+        {"success": True, "result": {"n": 3}},
+    ]
+    assert transport._pending == {}
+
+
+def test_sse_accepted_post_body_is_drained_before_release():
+    """Test the 202 body is read before closing so the keep-alive connection is pooled."""
+    events = []
+    accepted = MagicMock()
+    accepted.ok = True
+    type(accepted).content = PropertyMock(side_effect=lambda: events.append("read") or b"Accepted")
+    accepted.close.side_effect = lambda: events.append("close")
+
+    mock_session = MagicMock()
+    mock_session.post.return_value = accepted
+    transport = SSETransport()
+    transport._session = mock_session
+    transport._message_endpoint = "http://localhost:3000/message"
+
+    future = transport._dispatch_request({"jsonrpc": "2.0", "method": "tools/list", "id": 1})
+
+    assert events == ["read", "close"]
+    assert not future.done()
+    assert 1 in transport._pending
+
+
+def test_sse_responses_are_routed_by_request_id():
+    """Test out-of-order responses reach the caller waiting on their ID."""
+    transport = SSETransport()
+    transport._base_url = "http://localhost:3000"
+    first, second = Future(), Future()
+    transport._pending = {1: first, 2: second}
+
+    transport._process_sse_data(json.dumps({"jsonrpc": "2.0", "id": 2, "result": {"n": 2}}).encode())
+    transport._process_sse_data(json.dumps({"jsonrpc": "2.0", "id": 99, "result": {}}).encode())
+    transport._process_sse_data(json.dumps({"jsonrpc": "2.0", "id": 1, "result": {"n": 1}}).encode())
+
+    assert first.result(timeout=0)["result"] == {"n": 1}
+    assert second.result(timeout=0)["result"] == {"n": 2}
+    assert transport._pending == {}
+
+
+def test_sse_listener_reassembles_lines_across_reads():
+    """Test the listener handles split reads, CRLF endings, non-data fields and unspaced data."""
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.raw.read1.side_effect = [
+        b"event: endpoint\r\ndata: /messa",
+        b'ges?session=1\r\n\r\nevent: message\ndata: {"jsonrpc": "2.0", ',
+        b'"id": 1, "result": {}}\n\n: ping\nid: 7\nretry: 100\n',
+        b'data:{"jsonrpc": "2.0", "id": 2, "result": {}}\n',
+        b"",
+    ]
+    session = MagicMock()
+    session.get.return_value = response
+
+    transport = SSETransport()
+    transport._base_url = "http://localhost:3000"
+    transport._session = session
+    waiting, unspaced = Future(), Future()
+    transport._pending = {1: waiting, 2: unspaced}
+
+    transport._listen_sse("http://localhost:3000/sse")
+
+    assert transport._message_endpoint == "http://localhost:3000/messages?session=1"
+    assert waiting.result(timeout=0) == {"jsonrpc": "2.0", "id": 1, "result": {}}
+    assert unspaced.result(timeout=0) == {"jsonrpc": "2.0", "id": 2, "result": {}}
+
+
+def test_sse_listener_decodes_gzip_encoded_stream():
+    """Test a gzip Content-Encoding on the event stream is decoded before frames are parsed."""
+    body = gzip.compress(b'event: endpoint\ndata: /messages\n\ndata: {"jsonrpc": "2.0", "id": 1, "result": {}}\n\n')
+    response = MagicMock()
+    response.__enter__.return_value = response
+    # requests hands over its raw urllib3 response with decoding switched off
+    response.raw = HTTPResponse(
+        body=io.BytesIO(body),
+        headers={"Content-Encoding": "gzip"},
+        status=200,
+        preload_content=False,
+        decode_content=False,
+    )
+    session = MagicMock()
+    session.get.return_value = response
+
+    transport = SSETransport()
+    transport._base_url = "http://localhost:3000"
+    transport._session = session
+    waiting = Future()
+    transport._pending = {1: waiting}
+
+    transport._listen_sse("http://localhost:3000/sse")
+
+    assert transport._message_endpoint == "http://localhost:3000/messages"
+    assert waiting.result(timeout=0) == {"jsonrpc": "2.0", "id": 1, "result": {}}
+
+
+def test_sse_listener_survives_non_object_payloads(caplog):
+    """Test JSON arrays, numbers and strings are dropped without ending the listener."""
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.raw.read1.side_effect = [
+        b'data: [1, 2]\ndata: 42\ndata: "text"\n',
+        b'data: {"jsonrpc": "2.0", "id": 1, "result": {}}\n',
+        b"",
+    ]
+    session = MagicMock()
+    session.get.return_value = response
+
+    transport = SSETransport()
+    transport._session = session
+    waiting = Future()
+    transport._pending = {1: waiting}
+
+    with caplog.at_level(logging.DEBUG, logger="asterism.mcp.transport_executor.sse"):
+        transport._listen_sse("http://localhost:3000/sse")
+
+    assert waiting.result(timeout=0) == {"jsonrpc": "2.0", "id": 1, "result": {}}
+    assert [r.getMessage() for r in caplog.records] == [
+        "Dropped non-object SSE payload: list",
+        "Dropped non-object SSE payload: int",
+        "Dropped non-object SSE payload: str",
+    ]
+
+
+def test_sse_concurrent_requests_get_unique_ids():
+    """Test request IDs stay unique when requests are built from many threads."""
+    transport = SSETransport()
+    ids = []
+
+    def build():
+        for _ in range(200):
+            ids.append(transport._build_tool_request("tool", {}, transport._next_request_id())["id"])
+
+    threads = [threading.Thread(target=build) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(ids) == list(range(1, 801))
+
+
+def test_sse_pending_map_is_bounded_and_logs_unmatched_responses(caplog):
+    """Test the oldest waiter is failed at the cap and stray replies are only logged."""
+    mock_session = MagicMock()
+    mock_session.post.return_value.ok = True
+    transport = SSETransport()
+    transport._base_url = "http://localhost:3000"
+    transport._session = mock_session
+    transport._message_endpoint = "http://localhost:3000/message"
+
+    with patch("asterism.mcp.transport_executor.sse._MAX_PENDING_REQUESTS", 2):
+        first = transport._dispatch_request({"jsonrpc": "2.0", "method": "tools/list", "id": 1})
+        transport._dispatch_request({"jsonrpc": "2.0", "method": "tools/list", "id": 2})
+        transport._dispatch_request({"jsonrpc": "2.0", "method": "tools/list", "id": 3})
+
+    assert first.result(timeout=0) == {"error": "Request dropped: too many requests in flight"}
+    assert list(transport._pending) == [2, 3]
+
+    with pytest.raises(RuntimeError, match="already in flight"):
+        transport._dispatch_request({"jsonrpc": "2.0", "method": "tools/list", "id": 2})
+
+    with caplog.at_level(logging.DEBUG, logger="asterism.mcp.transport_executor.sse"):
+        transport._process_sse_data(b'{"jsonrpc": "2.0", "id": 1, "result": {}}')
+        transport._process_sse_data(b'{"jsonrpc": "2.0", "method": "notifications/progress"}')
+    assert [r.getMessage() for r in caplog.records] == ["Dropped SSE response for unmatched request ID 1"]
+
+
+def test_sse_stop_releases_pending_requests():
+    """Test stop resolves requests still waiting for a response."""
+    transport = SSETransport()
+    waiting = Future()
+    transport._pending = {1: waiting}
+
+    transport.stop()
+
+    assert waiting.result(timeout=0) == {"error": "SSE transport stopped"}
+    assert transport._pending == {}
+
+
 @patch("asterism.mcp.transport_executor.sse.requests.Session")
 @patch("asterism.mcp.transport_executor.sse.threading.Thread")
 def test_sse_list_tools_not_initialized_returns_empty(mock_thread_class, mock_session_class):
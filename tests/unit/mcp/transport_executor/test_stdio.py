@@ -1,7 +1,10 @@
 """Unit tests for StdioTransport."""
 
+import io
 import json
 import subprocess
+import sys
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -9,6 +12,15 @@ import pytest
 from asterism.mcp.transport_executor.stdio import StdioTransport
 
 
+def _response_line(payload: dict) -> bytes:
+    """Encode a JSON-RPC reply the way the server writes it to the binary stdout pipe."""
+    return json.dumps(payload).encode() + b"\n"
+
+
+# Server reply to the initialize handshake that every start() performs
+_INIT_RESPONSE = _response_line({"jsonrpc": "2.0", "id": 1, "result": {"protocolVersion": "2024-11-05"}})
+
+
 def test_stdio_transport_init():
     """Test StdioTransport initialization."""
     transport = StdioTransport()
@@ -22,9 +34,7 @@ def test_stdio_start_success(mock_popen_class):
     """Test successful start and initialization."""
     # Setup mock process
     mock_process = MagicMock()
-    mock_process.stdout.readline.return_value = json.dumps(
-        {"jsonrpc": "2.0", "id": 1, "result": {"protocolVersion": "2024-11-05"}}
-    )
+    mock_process.stdout.readline.return_value = _INIT_RESPONSE
     mock_process.poll.return_value = None
     mock_popen_class.return_value = mock_process
 
@@ -36,13 +46,14 @@ def test_stdio_start_success(mock_popen_class):
         stdin=-1,
         stdout=-1,
         stderr=-1,
-        text=True,
-        bufsize=1,
-        universal_newlines=True,
+        bufsize=65536,
         cwd=None,
     )
     assert transport._initialized is True
     assert transport._process is not None
+    written = [c.args[0] for c in mock_process.stdin.write.call_args_list]
+    assert all(isinstance(line, bytes) and line.endswith(b"\n") for line in written)
+    assert json.loads(written[0])["method"] == "initialize"
 
 
 @patch("asterism.mcp.transport_executor.stdio.subprocess.Popen")
@@ -54,8 +65,8 @@ def test_stdio_execute_tool_success(mock_popen_class):
 
     # First call for initialization, second for tool execution
     mock_process.stdout.readline.side_effect = [
-        json.dumps({"jsonrpc": "2.0", "id": 1, "result": {"protocolVersion": "2024-11-05"}}),
-        json.dumps(
+        _INIT_RESPONSE,
+        _response_line(
             {
                 "jsonrpc": "2.0",
                 "id": 2,
@@ -82,8 +93,8 @@ def test_stdio_list_tools_success(mock_popen_class):
 
     # First call for initialization, second for list_tools
     mock_process.stdout.readline.side_effect = [
-        json.dumps({"jsonrpc": "2.0", "id": 1, "result": {"protocolVersion": "2024-11-05"}}),
-        json.dumps(
+        _INIT_RESPONSE,
+        _response_line(
             {
                 "jsonrpc": "2.0",
                 "id": 2,
@@ -110,9 +121,7 @@ def test_stdio_is_alive(mock_popen_class):
 
     # Setup mock process
     mock_process = MagicMock()
-    mock_process.stdout.readline.return_value = json.dumps(
-        {"jsonrpc": "2.0", "id": 1, "result": {"protocolVersion": "2024-11-05"}}
-    )
+    mock_process.stdout.readline.return_value = _INIT_RESPONSE
     mock_process.poll.return_value = None
     mock_popen_class.return_value = mock_process
 
@@ -127,9 +136,7 @@ def test_stdio_is_alive(mock_popen_class):
 def test_stdio_stop_terminates_process(mock_popen_class):
     """Test stop terminates the process."""
     mock_process = MagicMock()
-    mock_process.stdout.readline.return_value = json.dumps(
-        {"jsonrpc": "2.0", "id": 1, "result": {"protocolVersion": "2024-11-05"}}
-    )
+    mock_process.stdout.readline.return_value = _INIT_RESPONSE
     mock_process.poll.return_value = None
     mock_popen_class.return_value = mock_process
 
@@ -146,9 +153,7 @@ def test_stdio_stop_terminates_process(mock_popen_class):
 def test_stdio_stop_kills_process_if_needed(mock_popen_class):
     """Test stop kills process if terminate times out."""
     mock_process = MagicMock()
-    mock_process.stdout.readline.return_value = json.dumps(
-        {"jsonrpc": "2.0", "id": 1, "result": {"protocolVersion": "2024-11-05"}}
-    )
+    mock_process.stdout.readline.return_value = _INIT_RESPONSE
     mock_process.poll.return_value = None
     mock_process.wait.side_effect = [subprocess.TimeoutExpired(cmd="test", timeout=5), None]
     mock_popen_class.return_value = mock_process
@@ -169,8 +174,8 @@ def test_stdio_execute_tool_python_literal_parsing(mock_popen_class):
 
     # First call for initialization, second for tool execution with Python literal
     mock_process.stdout.readline.side_effect = [
-        json.dumps({"jsonrpc": "2.0", "id": 1, "result": {"protocolVersion": "2024-11-05"}}),
-        json.dumps(
+        _INIT_RESPONSE,
+        _response_line(
             {
                 "jsonrpc": "2.0",
                 "id": 2,
@@ -195,8 +200,8 @@ def test_stdio_execute_tool_empty_content(mock_popen_class):
     mock_process.poll.return_value = None
 
     mock_process.stdout.readline.side_effect = [
-        json.dumps({"jsonrpc": "2.0", "id": 1, "result": {"protocolVersion": "2024-11-05"}}),
-        json.dumps(
+        _INIT_RESPONSE,
+        _response_line(
             {
                 "jsonrpc": "2.0",
                 "id": 2,
@@ -221,8 +226,8 @@ def test_stdio_list_tools_returns_tool_names(mock_popen_class):
     mock_process.poll.return_value = None
 
     mock_process.stdout.readline.side_effect = [
-        json.dumps({"jsonrpc": "2.0", "id": 1, "result": {"protocolVersion": "2024-11-05"}}),
-        json.dumps(
+        _INIT_RESPONSE,
+        _response_line(
             {
                 "jsonrpc": "2.0",
                 "id": 2,
@@ -247,5 +252,79 @@ def test_stdio_list_tools_returns_tool_names(mock_popen_class):
     assert "get_date" in tools
 
 
+@patch("asterism.mcp.transport_executor.stdio.threading.Thread")
+@patch("asterism.mcp.transport_executor.stdio.subprocess.Popen")
+def test_stdio_start_drains_stderr_in_background(mock_popen_class, mock_thread_class):
+    """Test start hands the server's stderr pipe to a daemon drain thread."""
+    mock_process = MagicMock()
+    mock_process.stdout.readline.return_value = _response_line({"jsonrpc": "2.0", "id": 1, "result": {}})
+    mock_popen_class.return_value = mock_process
+
+    transport = StdioTransport()
+    transport.start("python", ["-m", "test_server"])
+
+    mock_thread_class.assert_called_once_with(target=transport._drain_stderr, args=(mock_process.stderr,))
+    assert mock_thread_class.return_value.daemon is True
+    mock_thread_class.return_value.start.assert_called_once()
+
+
+def test_stdio_drain_stderr_consumes_until_eof():
+    """Test the drain reads the pipe to EOF and tolerates it being closed."""
+    transport = StdioTransport()
+    stderr = io.BytesIO(b"warning: one\nwarning: two\n")
+
+    transport._drain_stderr(stderr)
+    assert stderr.read() == b""
+
+    stderr.close()
+    transport._drain_stderr(stderr)
+
+
+# Writes far more than an OS pipe buffer holds to stderr before answering on stdout
+_CHATTY_SERVER = """
+import json, sys
+sys.stderr.write("x" * (4 * 1024 * 1024))
+sys.stderr.flush()
+for line in sys.stdin:
+    request = json.loads(line)
+    if "id" not in request:
+        continue
+    if request["method"] == "initialize":
+        result = {"protocolVersion": "2024-11-05"}
+    else:
+        result = {"tools": [{"name": "echo"}]}
+    print(json.dumps({"jsonrpc": "2.0", "id": request["id"], "result": result}), flush=True)
+"""
+
+
+def test_stdio_large_stderr_output_does_not_block():
+    """Test a server flooding stderr still answers once the drain thread empties the pipe."""
+    transport = StdioTransport()
+    tools: list[str] = []
+
+    def run() -> None:
+        transport.start(sys.executable, ["-c", _CHATTY_SERVER])
+        tools.extend(transport.list_tools())
+
+    worker = threading.Thread(target=run, daemon=True)
+    try:
+        worker.start()
+        worker.join(timeout=10)
+        assert not worker.is_alive(), "server blocked on a full stderr pipe"
+        assert tools == ["echo"]
+    finally:
+        transport.stop()
+
+
+def test_stdio_parse_tool_output_keeps_quoted_strings_intact():
+    """Test single-quoted output is parsed as a Python literal without corrupting strings."""
+    transport = StdioTransport()
+
+    assert transport._parse_tool_output("{'key': ['a', 'b']}") == {"key": ["a", "b"]}
+    assert transport._parse_tool_output("['a', \"b', 'c\"]") == ["a", "b', 'c"]
+    assert transport._parse_tool_output("{'flag': True, 'note': \"it's\"}") == {"flag": True, "note": "it's"}
+    assert transport._parse_tool_output("plain text, isn't it") == "plain text, isn't it"
+
+
 if __name__ == "__main__":
     pytest.main([__file__])